@@ -1,9 +1,53 @@
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 import json
 import os
 from datetime import datetime
 from pathlib import Path
 
+# Buffer for JSON file I/O; collection files routinely exceed the 8 KiB default
+BUFFER_SIZE = 64 * 1024
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used without it
+    orjson = None
+
+
+def json_loads(data):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data):
+    """Serialize to indented UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_file_atomic(filepath, data):
+    """Durably replace filepath with data (bytes) via a synced temporary file"""
+    directory = os.path.dirname(filepath) or '.'
+    os.makedirs(directory, exist_ok=True)
+    
+    # Use temporary file for atomic write
+    temp_file = f"{filepath}.tmp"
+    with open(temp_file, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    
+    # Atomic rename, then sync the directory so the rename itself survives a crash
+    os.replace(temp_file, filepath)
+    if os.name != 'nt':  # Directories can't be opened for syncing on Windows
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
 
 class BaseManager(QObject):
     """Base class for all managers with common functionality"""
@@ -18,14 +62,21 @@ class BaseManager(QObject):
     def ensure_directory_exists(self, directory_path):
         """Ensure a directory exists, create if it doesn't"""
         try:
-            if not os.path.exists(directory_path):
-                os.makedirs(directory_path)
-                return True
+            # One call, no separate existence check to race against
+            Path(directory_path).mkdir(parents=True, exist_ok=True)
             return True
         except Exception as e:
             self.error.emit(f"Cannot create directory {directory_path}: {e}")
             return False
     
+    def create_save_timer(self, save_callback, interval_ms=500):
+        """Create a single-shot timer that coalesces bursts of saves into one write"""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(interval_ms)
+        timer.timeout.connect(save_callback)
+        return timer
+    
     def backup_file(self, filepath):
         """Create a backup of the file with timestamp"""
         try:
@@ -41,16 +92,7 @@ class BaseManager(QObject):
     def atomic_write_json(self, data, filepath):
         """Write JSON data atomically using temporary file"""
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            
-            # Use temporary file for atomic write
-            temp_file = f"{filepath}.tmp"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            # Atomic rename
-            os.replace(temp_file, filepath)
+            write_file_atomic(filepath, json_dumps(data))
             return True
         except Exception as e:
             self.error.emit(f"Error writing file {filepath}: {e}")
@@ -60,13 +102,13 @@ class BaseManager(QObject):
         """Read JSON file with error handling"""
         try:
             if os.path.exists(filepath):
-                with open(filepath, 'r', encoding='utf-8') as f:
+                with open(filepath, 'rb', buffering=BUFFER_SIZE) as f:
                     content = f.read().strip()
                     if not content:
                         return default_value
-                    return json.loads(content)
+                    return json_loads(content)
             return default_value
-        except json.JSONDecodeError:
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
             self.error.emit(f"File {filepath} is corrupted. Creating backup...")
             self.backup_file(filepath)
             return default_value
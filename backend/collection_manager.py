@@ -1,8 +1,26 @@
 from PySide6.QtCore import Signal, Slot, Property
-from .base_manager import BaseManager
+from .base_manager import BaseManager, BUFFER_SIZE
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import ijson
+except ImportError:  # Optional: without it note counts parse the whole file
+    ijson = None
+
+
+# Characters that are invalid in filenames on at least one supported platform
+_FILENAME_SUB = re.compile(r'[<>:"/\\|?*]')
+
+
+@lru_cache(maxsize=128)
+def _collection_file_path(collections_dir, collection_name):
+    """File path for a collection name; a pure mapping, so results never go stale"""
+    # Remove invalid filename characters and limit length
+    safe_name = _FILENAME_SUB.sub('_', collection_name).strip()[:50] or "Unnamed"
+    return os.path.join(collections_dir, f"{safe_name}.json")
 
 
 class CollectionManager(BaseManager):
@@ -10,6 +28,7 @@ class CollectionManager(BaseManager):
     
     collectionsChanged = Signal()
     currentCollectionChanged = Signal()
+    preferredColumnsChanged = Signal()
     
     def __init__(self, config_manager):
         super().__init__()
@@ -19,34 +38,27 @@ class CollectionManager(BaseManager):
         
         # Collections state
         self._collections = []
+        self._collection_names = set()  # Shadow of _collections for O(1) membership tests
         self._current_collection = ""
         self._collection_settings = {}  # Per-collection layout settings
+        self._settings_cache = None  # Current collection's layout, see _refresh_settings_cache
+        self._collection_info_cache = {}  # file path -> ((mtime_ns, size), note count)
+        self._save_timer = self.create_save_timer(self.save_collections)
         
-        # Initialize
-        self.ensure_directory_exists("data")
+        # Initialize (creates data/ as the parent of the collections directory)
         self.ensure_directory_exists(self.collections_dir)
         self.load_collections()
     
     def get_collection_file_path(self, collection_name):
         """Get the file path for a collection with proper sanitization"""
-        # Remove invalid filename characters and limit length
-        safe_name = re.sub(r'[<>:"/\\|?*]', '_', collection_name)
-        safe_name = safe_name.strip()[:50]  # Limit filename length
-        if not safe_name:
-            safe_name = "Unnamed"
-        
-        file_path = os.path.join(self.collections_dir, f"{safe_name}.json")
-        return file_path
+        return _collection_file_path(self.collections_dir, collection_name)
     
     def create_collection_file(self, collection_name):
         """Create a collection file with proper error handling"""
         collection_file = self.get_collection_file_path(collection_name)
         
         try:
-            # Ensure the directory exists
-            os.makedirs(os.path.dirname(collection_file), exist_ok=True)
-            
-            # Create the file with empty array
+            # Create the file with empty array (atomic_write_json creates the directory)
             if self.atomic_write_json([], collection_file):
                 return True
             return False
@@ -81,11 +93,12 @@ class CollectionManager(BaseManager):
         })
         
         self._collections = collections_data.get("collections", [])
+        self._collection_names = set(self._collections)
         self._current_collection = collections_data.get("currentCollection", "")
         self._collection_settings = collections_data.get("collectionSettings", {})
                 
         # Ensure current collection exists in the list (if we have collections)
-        if self._collections and self._current_collection not in self._collections:
+        if self._collections and self._current_collection not in self._collection_names:
             self._current_collection = self._collections[0] if self._collections else ""
         
         # Initialize collection settings for existing collections that don't have them
@@ -111,9 +124,12 @@ class CollectionManager(BaseManager):
                 self.config_manager.set_value("cardWidth", collection_settings["cardWidth"])
             if "cardHeight" in collection_settings:
                 self.config_manager.set_value("cardHeight", collection_settings["cardHeight"])
+        
+        self._refresh_settings_cache()
     
     def save_collections(self):
         """Save collections metadata"""
+        self._save_timer.stop()  # This write covers any pending deferred save
         collections_data = {
             "collections": self._collections,
             "currentCollection": self._current_collection,
@@ -122,10 +138,27 @@ class CollectionManager(BaseManager):
         
         return self.atomic_write_json(collections_data, self.collections_file)
     
-    def get_current_collection_card_width(self):
-        """Get the card width for the current collection"""
+    def schedule_save(self):
+        """Save after a short quiet period, coalescing rapid layout changes into one write"""
+        self._save_timer.start()
+    
+    def flush_pending_save(self):
+        """Write a deferred save immediately, if one is pending"""
+        if self._save_timer.isActive():
+            self.save_collections()
+    
+    def _refresh_settings_cache(self):
+        """Recompute the cached (cardWidth, cardHeight, preferredColumns) of the current collection"""
+        previous_columns = self.get_current_collection_preferred_columns()
+        self._update_settings_cache()
+        if self.get_current_collection_preferred_columns() != previous_columns:
+            self.preferredColumnsChanged.emit()
+    
+    def _update_settings_cache(self):
+        """Store the current collection's layout settings in _settings_cache"""
         if not self._current_collection:
-            return self.config_manager.get_value("cardWidth", 381)
+            self._settings_cache = None  # Getters fall back to the global config
+            return
         
         if self._current_collection not in self._collection_settings:
             # Initialize settings for this collection
@@ -135,41 +168,34 @@ class CollectionManager(BaseManager):
                 "preferredColumns": 1  # Default to 1 column
             }
         
-        return self._collection_settings[self._current_collection].get("cardWidth", 381)
+        settings = self._collection_settings[self._current_collection]
+        self._settings_cache = (
+            settings.get("cardWidth", 381),
+            settings.get("cardHeight", 120),
+            settings.get("preferredColumns", 1)
+        )
+    
+    def get_current_collection_card_width(self):
+        """Get the card width for the current collection"""
+        if self._settings_cache is None:
+            return self.config_manager.get_value("cardWidth", 381)
+        return self._settings_cache[0]
 
     def get_current_collection_card_height(self):
         """Get the card height for the current collection"""
-        if not self._current_collection:
+        if self._settings_cache is None:
             return self.config_manager.get_value("cardHeight", 120)
-        
-        if self._current_collection not in self._collection_settings:
-            # Initialize settings for this collection
-            self._collection_settings[self._current_collection] = {
-                "cardWidth": self.config_manager.get_value("cardWidth", 381),
-                "cardHeight": self.config_manager.get_value("cardHeight", 120),
-                "preferredColumns": 1  # Default to 1 column
-            }
-        
-        return self._collection_settings[self._current_collection].get("cardHeight", 120)
+        return self._settings_cache[1]
 
     def get_current_collection_preferred_columns(self):
         """Get the preferred column count for the current collection"""
-        if not self._current_collection:
+        if self._settings_cache is None:
             return 1
-        
-        if self._current_collection not in self._collection_settings:
-            # Initialize settings for this collection
-            self._collection_settings[self._current_collection] = {
-                "cardWidth": self.config_manager.get_value("cardWidth", 381),
-                "cardHeight": self.config_manager.get_value("cardHeight", 120),
-                "preferredColumns": 1  # Default to 1 column
-            }
-        
-        return self._collection_settings[self._current_collection].get("preferredColumns", 1)
+        return self._settings_cache[2]
 
     def set_current_collection_preferred_columns(self, columns):
         """Set the preferred column count for the current collection"""
-        if not self._current_collection:
+        if not self._current_collection or columns == self.get_current_collection_preferred_columns():
             return
         
         if self._current_collection not in self._collection_settings:
@@ -180,25 +206,8 @@ class CollectionManager(BaseManager):
             }
         
         self._collection_settings[self._current_collection]["preferredColumns"] = columns
-        self.save_collections()
-
-    def set_current_collection_card_width(self, width):
-        """Set the card width for the current collection"""
-        if not self._current_collection:
-            return
-        
-        if self._current_collection not in self._collection_settings:
-            self._collection_settings[self._current_collection] = {
-                "cardHeight": self.config_manager.get_value("cardHeight", 120)
-            }
-        
-        self._collection_settings[self._current_collection]["cardWidth"] = width
-        
-        # Also update the global config for immediate UI update
-        self.config_manager.set_value("cardWidth", width)
-        
-        # Save collections
-        self.save_collections()
+        self._refresh_settings_cache()
+        self.schedule_save()
 
     def set_current_collection_card_height(self, height):
         """Set the card height for the current collection"""
@@ -213,12 +222,13 @@ class CollectionManager(BaseManager):
             }
         
         self._collection_settings[self._current_collection]["cardHeight"] = height
+        self._refresh_settings_cache()
         
         # Also update the global config for immediate UI update
-        self.config_manager.set_value("cardHeight", height)
+        self.config_manager.set_value("cardHeight", height, deferred=True)
         
-        # Save collections
-        self.save_collections()
+        # Save collections once resizing settles
+        self.schedule_save()
     
     # QML-accessible methods
     @Slot(result=bool)
@@ -236,6 +246,7 @@ class CollectionManager(BaseManager):
         
         # Initialize collections system
         self._collections = [clean_name]
+        self._collection_names = {clean_name}
         self._current_collection = clean_name
         
         # Initialize collection settings
@@ -244,6 +255,7 @@ class CollectionManager(BaseManager):
             "cardHeight": self.config_manager.get_value("cardHeight", 120),
             "preferredColumns": 1  # Default to 1 column
         }
+        self._refresh_settings_cache()
         
         # Create the collection file
         if self.create_collection_file(clean_name):
@@ -261,11 +273,12 @@ class CollectionManager(BaseManager):
             return False
             
         clean_name = name.strip()
-        if clean_name in self._collections:
+        if clean_name in self._collection_names:
             return False  # Collection already exists
         
         # Add to collections list
         self._collections.append(clean_name)
+        self._collection_names.add(clean_name)
         
         # Initialize collection settings with current card dimensions
         self._collection_settings[clean_name] = {
@@ -283,21 +296,24 @@ class CollectionManager(BaseManager):
             else:
                 # Cleanup if save failed
                 self._collections.remove(clean_name)
+                self._collection_names.discard(clean_name)
                 return False
         else:
             # Remove from collections list if file creation failed
             self._collections.remove(clean_name)
+            self._collection_names.discard(clean_name)
             return False
 
     @Slot(str)
     def switchCollection(self, name):
         """Switch to a different collection"""
-        if name not in self._collections:
+        if name not in self._collection_names:
             return
 
         if self._current_collection != name:
             old_collection = self._current_collection
             self._current_collection = name
+            self._refresh_settings_cache()
 
             # Restore layout preferences for the new collection
             new_card_width = self.get_current_collection_card_width()
@@ -318,6 +334,7 @@ class CollectionManager(BaseManager):
                 if not self.create_collection_file(name):
                     # Revert to old collection if file creation failed
                     self._current_collection = old_collection
+                    self._refresh_settings_cache()
                     return
 
             # Save collections metadata
@@ -336,11 +353,12 @@ class CollectionManager(BaseManager):
         if len(self._collections) <= 1:
             return False  # Don't delete the last collection
             
-        if name not in self._collections:
+        if name not in self._collection_names:
             return False
         
         # Remove from collections list
         self._collections.remove(name)
+        self._collection_names.discard(name)
         
         # Delete the file (with backup)
         try:
@@ -355,6 +373,7 @@ class CollectionManager(BaseManager):
         # If we deleted the current collection, switch to the first available
         if self._current_collection == name:
             self._current_collection = self._collections[0]
+            self._refresh_settings_cache()
             self.currentCollectionChanged.emit()
             
         self.save_collections()
@@ -364,16 +383,18 @@ class CollectionManager(BaseManager):
     @Slot(str, str, result=bool)
     def renameCollection(self, old_name, new_name):
         """Rename a collection and its file"""
-        if old_name not in self._collections or new_name.strip() == "":
+        if old_name not in self._collection_names or new_name.strip() == "":
             return False
             
         clean_new_name = new_name.strip()
-        if clean_new_name in self._collections:
+        if clean_new_name in self._collection_names:
             return False  # New name already exists
         
         # Update collections list
         index = self._collections.index(old_name)
         self._collections[index] = clean_new_name
+        self._collection_names.discard(old_name)
+        self._collection_names.add(clean_new_name)
         
         # Rename the file
         try:
@@ -390,20 +411,47 @@ class CollectionManager(BaseManager):
             self.error.emit(f"Error renaming collection file: {e}")
             # Revert collections list change
             self._collections[index] = old_name
+            self._collection_names.discard(clean_new_name)
+            self._collection_names.add(old_name)
             return False
         
         # Update current collection if it was the renamed one
         if self._current_collection == old_name:
             self._current_collection = clean_new_name
+            self._refresh_settings_cache()
             self.currentCollectionChanged.emit()
             
         self.save_collections()
         self.collectionsChanged.emit()
         return True
 
+    def _count_notes(self, collection_file, file_key):
+        """Number of notes in a collection file, recounted only when the file changes"""
+        cached = self._collection_info_cache.get(collection_file)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+        
+        if ijson is not None:
+            # Stream the array so the file is never held in memory as a whole
+            with open(collection_file, 'rb', buffering=BUFFER_SIZE) as f:
+                note_count = sum(1 for _ in ijson.items(f, 'item'))
+        else:
+            notes = self.read_json_file(collection_file, [])
+            note_count = len(notes) if isinstance(notes, list) else 0
+        
+        self._collection_info_cache[collection_file] = (file_key, note_count)
+        return note_count
+    
     @Slot(result='QVariant')
     def getCollectionInfo(self):
         """Get information about all collections"""
+        # One directory listing instead of separate exists/stat calls per collection
+        try:
+            with os.scandir(self.collections_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = {}
+        
         info = []
         for collection_name in self._collections:
             collection_file = self.get_collection_file_path(collection_name)
@@ -411,10 +459,11 @@ class CollectionManager(BaseManager):
             file_size = 0
             
             try:
-                if os.path.exists(collection_file):
-                    file_size = os.path.getsize(collection_file)
-                    notes = self.read_json_file(collection_file, [])
-                    note_count = len(notes) if isinstance(notes, list) else 0
+                entry = entries.get(os.path.basename(collection_file))
+                if entry is not None:
+                    stat = entry.stat()
+                    file_size = stat.st_size
+                    note_count = self._count_notes(collection_file, (stat.st_mtime_ns, stat.st_size))
             except Exception:
                 pass  # Error reading collection
             
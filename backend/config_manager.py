@@ -2,6 +2,25 @@ from PySide6.QtCore import Signal, Slot, Property
 from .base_manager import BaseManager
 
 
+# Numeric setting -> (minimum, maximum or None for no upper bound)
+_CONFIG_VALIDATORS = {
+    # Font sizes
+    "fontSize": (8, 72),
+    "cardTitleFontSize": (8, 72),
+    "headerFontSize": (8, 72),
+    "cardFontSize": (8, 72),
+    # Card dimensions
+    "cardWidth": (150, 500),
+    "cardHeight": (120, 400),
+    # Other numeric values
+    "maxUnsavedChanges": (50, None),
+    "autoSaveInterval": (100, None),
+    "searchDebounceInterval": (100, None),
+    "windowWidth": (100, None),
+    "windowHeight": (100, None),
+}
+
+
 class ConfigManager(BaseManager):
     """Manages application configuration"""
     
@@ -11,6 +30,7 @@ class ConfigManager(BaseManager):
         super().__init__()
         self.config_file = "config/config.json"
         self._config = {}
+        self._save_timer = self.create_save_timer(self.save_config)
         self.load_config()
     
     def get_default_config(self):
@@ -88,87 +108,67 @@ class ConfigManager(BaseManager):
             self._config = default_config
             self.save_config()
         else:
-            # Deep merge to preserve new defaults
-            for key, value in default_config.items():
-                if key not in loaded_config:
-                    loaded_config[key] = value
-                elif key == "shortcuts" and isinstance(value, dict):
-                    # Merge shortcuts, preserving user customizations
-                    merged_shortcuts = value.copy()
-                    merged_shortcuts.update(loaded_config[key])
-                    loaded_config[key] = merged_shortcuts
+            # Merge to preserve new defaults; shortcuts merge one level deeper
+            # so user customizations survive alongside newly added bindings
+            merged = {**default_config, **loaded_config}
+            merged["shortcuts"] = {**default_config["shortcuts"], **loaded_config.get("shortcuts", {})}
             
             # Validate configuration
-            self._config = self.validate_config(loaded_config, default_config)
+            self._config = self.validate_config(merged, default_config)
     
     def validate_config(self, config, defaults):
-        """Validate and sanitize configuration values"""
-        validated = config.copy()
-
-        # Validate font sizes
-        size_keys = ['fontSize', 'cardTitleFontSize', 'headerFontSize', 'cardFontSize']
-        for key in size_keys:
-            if key in validated:
-                try:
-                    size = int(validated[key])
-                    validated[key] = max(8, min(72, size))
-                except (ValueError, TypeError):
-                    validated[key] = defaults[key]
-
-        # Validate card dimensions
-        card_keys = ['cardWidth', 'cardHeight']
-        for key in card_keys:
-            if key in validated:
-                try:
-                    size = int(validated[key])
-                    if key == 'cardWidth':
-                        validated[key] = max(150, min(500, size))
-                    else:  # cardHeight
-                        validated[key] = max(120, min(400, size))
-                except (ValueError, TypeError):
-                    validated[key] = defaults[key]
-
-        # Validate numeric values
-        numeric_keys = ['maxUnsavedChanges', 'autoSaveInterval', 'searchDebounceInterval', 'windowWidth', 'windowHeight']
-        for key in numeric_keys:
-            if key in validated:
-                try:
-                    val = int(validated[key])
-                    validated[key] = max(50, val) if key == 'maxUnsavedChanges' else max(100, val)
-                except (ValueError, TypeError):
-                    validated[key] = defaults.get(key, 1000)
+        """Validate and sanitize configuration values, mutating config in place (callers pass a freshly merged dict); returns config"""
+        # Clamp every numeric setting in one pass over the bounds table
+        for key, (low, high) in _CONFIG_VALIDATORS.items():
+            if key not in config:
+                continue
+            try:
+                value = max(low, int(config[key]))
+                config[key] = value if high is None else min(high, value)
+            except (ValueError, TypeError):
+                config[key] = defaults.get(key, 1000)
 
         # Validate boolean values
         boolean_keys = ['autoSaveEnabled']
         for key in boolean_keys:
-            if key in validated:
-                if isinstance(validated[key], bool):
+            if key in config:
+                if isinstance(config[key], bool):
                     pass  # Already a boolean, keep as is
-                elif isinstance(validated[key], str):
-                    validated[key] = validated[key].lower() in ('true', '1', 'yes', 'on')
+                elif isinstance(config[key], str):
+                    config[key] = config[key].lower() in ('true', '1', 'yes', 'on')
                 else:
-                    validated[key] = bool(validated[key])
+                    config[key] = bool(config[key])
 
-        return validated
+        return config
     
     def save_config(self):
         """Save configuration"""
+        self._save_timer.stop()  # This write covers any pending deferred save
         if self.atomic_write_json(self._config, self.config_file):
             return True
         return False
     
+    def schedule_save(self):
+        """Save after a short quiet period, coalescing rapid changes into one write"""
+        self._save_timer.start()
+    
+    def flush_pending_save(self):
+        """Write a deferred save immediately, if one is pending"""
+        if self._save_timer.isActive():
+            self.save_config()
+    
     # Properties
     @Property('QVariant', notify=configChanged)
     def config(self):
         return self._config
     
-    # Font size controls
+    # Font size controls (held-down shortcuts; saves are coalesced)
     @Slot()
     def increaseFontSize(self):
         old_size = self._config["fontSize"]
         self._config["fontSize"] = min(100, self._config["fontSize"] + 1)
         if self._config["fontSize"] != old_size:
-            self.save_config()
+            self.schedule_save()
             self.configChanged.emit()
 
     @Slot()
@@ -176,7 +176,7 @@ class ConfigManager(BaseManager):
         old_size = self._config["fontSize"]
         self._config["fontSize"] = max(1, self._config["fontSize"] - 1)
         if self._config["fontSize"] != old_size:
-            self.save_config()
+            self.schedule_save()
             self.configChanged.emit()
 
     @Slot()
@@ -184,7 +184,7 @@ class ConfigManager(BaseManager):
         old_size = self._config["cardFontSize"]
         self._config["cardFontSize"] = min(100, self._config["cardFontSize"] + 1)
         if self._config["cardFontSize"] != old_size:
-            self.save_config()
+            self.schedule_save()
             self.configChanged.emit()
 
     @Slot()
@@ -192,7 +192,7 @@ class ConfigManager(BaseManager):
         old_size = self._config["cardFontSize"]
         self._config["cardFontSize"] = max(1, self._config["cardFontSize"] - 1)
         if self._config["cardFontSize"] != old_size:
-            self.save_config()
+            self.schedule_save()
             self.configChanged.emit()
 
     @Slot()
@@ -200,7 +200,7 @@ class ConfigManager(BaseManager):
         old_size = self._config["cardTitleFontSize"]
         self._config["cardTitleFontSize"] = min(32, self._config["cardTitleFontSize"] + 1)
         if self._config["cardTitleFontSize"] != old_size:
-            self.save_config()
+            self.schedule_save()
             self.configChanged.emit()
     
     @Slot()
@@ -208,7 +208,7 @@ class ConfigManager(BaseManager):
         old_size = self._config["cardTitleFontSize"]
         self._config["cardTitleFontSize"] = max(1, self._config["cardTitleFontSize"] - 1)
         if self._config["cardTitleFontSize"] != old_size:
-            self.save_config()
+            self.schedule_save()
             self.configChanged.emit()
     
     @Slot(int, int)
@@ -218,7 +218,7 @@ class ConfigManager(BaseManager):
             
             self._config["windowWidth"] = width
             self._config["windowHeight"] = height
-            self.save_config()
+            self.schedule_save()  # Fires per pixel while the window is resized
     
     @Slot(bool)
     def setAutoSaveEnabled(self, enabled):
@@ -232,11 +232,14 @@ class ConfigManager(BaseManager):
         """Get a config value"""
         return self._config.get(key, default)
     
-    def set_value(self, key, value):
+    def set_value(self, key, value, deferred=False):
         """Set a config value"""
         if self._config.get(key) != value:
             self._config[key] = value
-            self.save_config()
+            if deferred:
+                self.schedule_save()
+            else:
+                self.save_config()
             self.configChanged.emit()
             return True
         return False
\ No newline at end of file
@@ -1,39 +1,102 @@
 from PySide6.QtCore import Signal, Slot, QThread
 from PySide6.QtGui import QFontDatabase
-from .base_manager import BaseManager
-import json
-from datetime import datetime, timedelta
+from .base_manager import BaseManager, write_file_atomic
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+from datetime import timedelta
+
+
+# Vertical-writing (@) and hidden system (.) families are never useful in the picker
+_SKIP_PREFIXES = ('@', '.')
+
+# A saved font list older than this is rebuilt in the background
+FONT_CACHE_MAX_AGE = timedelta(days=30)
+
+# Common families offered until the real list has loaded (shared, never modified)
+_BASIC_FONTS = [
+    "Victor Mono", "Fira Code", "JetBrains Mono", "Iosevka", "Iosevka NFM",
+    "DejaVu Sans Mono", "Ubuntu Mono", "Consolas", "Courier New", "Monaco",
+    "Arial", "Helvetica", "Times New Roman", "Georgia", "Trebuchet MS"
+]
 
 
 class FontLoader(QThread):
     """Background thread for loading fonts without blocking UI - OPTIMIZED"""
-    fontsLoaded = Signal(list)
+    fontsLoaded = Signal(list, str)
+    
+    def __init__(self, cached_fingerprint=None, cached_fonts=None):
+        super().__init__()
+        self._cached_fingerprint = cached_fingerprint
+        self._cached_fonts = cached_fonts
     
     def run(self):
-        """Load all fonts without filtering patterns"""
+        """Load Latin-capable fonts, monospaced families first"""
         try:
-            font_db = QFontDatabase()
-            families = font_db.families()
+            families = self._fontconfig_families()
+            if families is not None:
+                find_fixed_pitch = self._fontconfig_fixed_pitch
+            else:
+                # Let Qt drop families without Latin coverage instead of filtering by name
+                families = QFontDatabase().families(QFontDatabase.WritingSystem.Latin)
+                find_fixed_pitch = self._qt_fixed_pitch
             
-            all_fonts = []
+            # The raw family listing is cheap; classifying it is not. If the system
+            # fonts are unchanged since the cached list was built, reuse that list.
+            fingerprint = hashlib.blake2b(
+                ('\n'.join(sorted(families)) + sys.platform).encode('utf-8'),
+                digest_size=8
+            ).hexdigest()
+            if self._cached_fonts and fingerprint == self._cached_fingerprint:
+                self.fontsLoaded.emit(self._cached_fonts, fingerprint)
+                return
             
-            for family in families:
-                family_lower = family.lower()
-                
-                # Only skip clearly problematic system fonts
-                if family_lower.startswith('@') or family_lower.startswith('.'):
-                    continue
-                
-                all_fonts.append(family)
+            fixed_pitch = find_fixed_pitch(families)
             
-            # Sort alphabetically
-            all_fonts = sorted(all_fonts)
+            # Monospaced fonts lead the list, each group sorted alphabetically, in
+            # one sort; only clearly problematic system fonts are skipped
+            all_fonts = sorted(
+                (f for f in families if not f.startswith(_SKIP_PREFIXES)),
+                key=lambda f: (f not in fixed_pitch, f)
+            )
             
-            self.fontsLoaded.emit(all_fonts)
+            self.fontsLoaded.emit(all_fonts, fingerprint)
             
         except Exception as e:
             # Emit empty list on error
-            self.fontsLoaded.emit([])
+            self.fontsLoaded.emit([], "")
+    
+    def _run_fc_list(self, pattern):
+        """Return the first family name of each font matching pattern"""
+        return subprocess.run(
+            ['fc-list', pattern, '-f', '%{family[0]}\n'],
+            capture_output=True, text=True, timeout=10, check=True
+        ).stdout.splitlines()
+    
+    def _fontconfig_families(self):
+        """Latin-capable families from fontconfig's cache on Linux; None if unavailable"""
+        if not sys.platform.startswith('linux') or shutil.which('fc-list') is None:
+            return None
+        try:
+            families = set(filter(None, self._run_fc_list(':lang=en')))
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return list(families) if families else None
+    
+    def _fontconfig_fixed_pitch(self, families):
+        """Monospaced families according to fontconfig"""
+        try:
+            return set(self._run_fc_list(':lang=en:spacing=mono'))
+        except (OSError, subprocess.SubprocessError):
+            return self._qt_fixed_pitch(families)
+    
+    def _qt_fixed_pitch(self, families):
+        """Monospaced families according to QFontDatabase"""
+        font_db = QFontDatabase()
+        return {family for family in families if font_db.isFixedPitch(family)}
 
 
 class FontManager(BaseManager):
@@ -49,42 +112,72 @@ class FontManager(BaseManager):
         self._font_cache = None
         self._font_loading = False
         self._font_loader = None
-        self._font_cache_file = "data/font_cache.json"
+        # Plain text: fingerprint line, then one family per line (age comes from the mtime)
+        self._font_cache_file = "data/font_cache.txt"
+        self._legacy_font_cache_file = "data/font_cache.json"
+        # Last saved list and its system fingerprint, kept even once stale so the
+        # loader can skip classification when the installed fonts are unchanged
+        self._cached_fingerprint = None
+        self._cached_fonts = None
+        # Only setFont writes this key, so the attribute stays in step with the config
+        self._current_font = config_manager.get_value("fontFamily", "Victor Mono")
+        # Position of each family in the list last cycled through (see _font_position)
+        self._font_index = {}
+        self._font_index_list = None
         
         # Initialize
         self.ensure_directory_exists("data")
         self._load_font_cache_from_disk()
+        # Enumeration is deferred until the font picker asks (ensureFontsLoaded)
     
     def _load_font_cache_from_disk(self):
         """Load font cache from disk if available"""
         try:
-            cached_data = self.read_json_file(self._font_cache_file)
-            if cached_data:
-                # Check if cache is recent (within 30 days - longer cache)
-                cache_time = datetime.fromisoformat(cached_data.get('timestamp', ''))
-                if datetime.now() - cache_time < timedelta(days=30):
-                    self._font_cache = cached_data.get('fonts', [])
-                    return True
+            if os.path.exists(self._font_cache_file):
+                cache_file = self._font_cache_file
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    fingerprint, *fonts = f.read().splitlines()
+            else:
+                # Fall back to the JSON cache written by earlier versions
+                cache_file = self._legacy_font_cache_file
+                cached_data = self.read_json_file(cache_file)
+                if not cached_data:
+                    return False
+                fingerprint = cached_data.get('fingerprint')
+                fonts = cached_data.get('fonts', [])
+            
+            self._cached_fingerprint = fingerprint or None
+            self._cached_fonts = fonts
+            # Check if cache is recent (within 30 days - longer cache)
+            age_seconds = time.time() - os.stat(cache_file).st_mtime
+            if age_seconds < FONT_CACHE_MAX_AGE.total_seconds():
+                self._font_cache = fonts
+                return True
         except Exception:
             pass
         return False
     
-    def _save_font_cache_to_disk(self, fonts):
+    def _save_font_cache_to_disk(self, fonts, fingerprint):
         """Save font cache to disk"""
         try:
-            cache_data = {
-                'timestamp': datetime.now().isoformat(),
-                'fonts': fonts
-            }
-            self.atomic_write_json(cache_data, self._font_cache_file)
+            lines = [fingerprint]
+            lines.extend(fonts)
+            write_file_atomic(self._font_cache_file, '\n'.join(lines).encode('utf-8'))
+            
+            # The text cache supersedes the old JSON one
+            if os.path.exists(self._legacy_font_cache_file):
+                os.remove(self._legacy_font_cache_file)
         except Exception:
             pass  # Ignore disk cache errors
     
-    def _on_fonts_loaded(self, fonts):
+    def _on_fonts_loaded(self, fonts, fingerprint):
         """Handle fonts loaded from background thread"""
         self._font_cache = fonts
         self._font_loading = False
-        self._save_font_cache_to_disk(fonts)
+        if fonts:
+            self._cached_fingerprint = fingerprint
+            self._cached_fonts = fonts
+            self._save_font_cache_to_disk(fonts, fingerprint)
         # Clean up thread
         if self._font_loader:
             self._font_loader.deleteLater()
@@ -92,6 +185,13 @@ class FontManager(BaseManager):
         # Notify QML that fonts are updated
         self.fontsUpdated.emit()
 
+    def _font_position(self, fonts, font_family):
+        """Index of font_family in fonts, or None; the lookup is rebuilt only when the list changes"""
+        if fonts is not self._font_index_list:
+            self._font_index = {name: i for i, name in enumerate(fonts)}
+            self._font_index_list = fonts
+        return self._font_index.get(font_family)
+
     # Font management methods with optimized caching
     @Slot(result=list)
     def getAvailableFonts(self):
@@ -100,32 +200,27 @@ class FontManager(BaseManager):
         if self._font_cache is not None:
             return self._font_cache
             
-        # Return immediate basic fonts while loading in background
-        basic_fonts = [
-            "Victor Mono", "Fira Code", "JetBrains Mono", "Iosevka", "Iosevka NFM",
-            "DejaVu Sans Mono", "Ubuntu Mono", "Consolas", "Courier New", "Monaco",
-            "Arial", "Helvetica", "Times New Roman", "Georgia", "Trebuchet MS"
-        ]
-        
         # Start background loading if not already started
         if not self._font_loading and self._font_loader is None:
             self._font_loading = True
-            self._font_loader = FontLoader()
+            self._font_loader = FontLoader(self._cached_fingerprint, self._cached_fonts)
             self._font_loader.fontsLoaded.connect(self._on_fonts_loaded)
             self._font_loader.start()
             
-        return basic_fonts  # Return basic fonts immediately
+        return _BASIC_FONTS  # Return basic fonts immediately while loading in background
     
     @Slot(result=str)
     def getCurrentFont(self):
         """Get current font family"""
-        return self.config_manager.get_value("fontFamily", "Victor Mono")
+        return self._current_font
     
     @Slot(str)
     def setFont(self, font_family):
         """Set the font family"""
         if font_family and font_family.strip():
-            self.config_manager.set_value("fontFamily", font_family.strip())
+            self._current_font = font_family.strip()
+            # Deferred: cycling through fonts should not write the config per step
+            self.config_manager.set_value("fontFamily", self._current_font, deferred=True)
     
     @Slot()
     def cycleFontForward(self):
@@ -134,13 +229,12 @@ class FontManager(BaseManager):
         if not available_fonts:
             return
             
-        current_font = self.getCurrentFont()
-        try:
-            current_index = available_fonts.index(current_font)
-            next_index = (current_index + 1) % len(available_fonts)
-        except ValueError:
+        current_index = self._font_position(available_fonts, self._current_font)
+        if current_index is None:
             # Current font not in list, start from beginning
             next_index = 0
+        else:
+            next_index = (current_index + 1) % len(available_fonts)
             
         next_font = available_fonts[next_index]
         self.setFont(next_font)
@@ -152,24 +246,28 @@ class FontManager(BaseManager):
         if not available_fonts:
             return
             
-        current_font = self.getCurrentFont()
-        try:
-            current_index = available_fonts.index(current_font)
-            prev_index = (current_index - 1) % len(available_fonts)
-        except ValueError:
+        current_index = self._font_position(available_fonts, self._current_font)
+        if current_index is None:
             # Current font not in list, start from end
             prev_index = len(available_fonts) - 1
+        else:
+            prev_index = (current_index - 1) % len(available_fonts)
             
         prev_font = available_fonts[prev_index]
         self.setFont(prev_font)
     
     @Slot()
-    def preloadFonts(self):
-        """Preload fonts in background to improve UI responsiveness"""
+    def ensureFontsLoaded(self):
+        """Start background font loading if nothing is cached or loading yet"""
         if self._font_cache is None and not self._font_loading:
             # Start threaded loading
             self.getAvailableFonts()
     
+    @Slot()
+    def preloadFonts(self):
+        """Preload fonts in background to improve UI responsiveness"""
+        self.ensureFontsLoaded()
+    
     @Slot(result=bool)
     def fontsLoading(self):
         """Check if fonts are currently being loaded"""
@@ -25,9 +25,14 @@ class MainManager(QAbstractListModel):
     saveError = Signal(str)
     loadError = Signal(str)
     saveSuccess = Signal()
-    cardBoundsNeedUpdate = Signal()
+    preferredColumnsChanged = Signal()
     fontsUpdated = Signal()
     
+    # Card grid geometry shared by the layout slots and (via the properties below) QML
+    _RIGHT_MARGIN = 10
+    _SCROLLBAR_SPACE = 10
+    _CARD_SPACING = 20
+    
     def __init__(self):
         super().__init__()
         
@@ -64,6 +69,7 @@ class MainManager(QAbstractListModel):
         # Collection signals
         self.collection_manager.collectionsChanged.connect(self.collectionsChanged)
         self.collection_manager.currentCollectionChanged.connect(self.currentCollectionChanged)
+        self.collection_manager.preferredColumnsChanged.connect(self.preferredColumnsChanged)
         self.collection_manager.error.connect(self.loadError)
         
         # Notes signals
@@ -72,7 +78,6 @@ class MainManager(QAbstractListModel):
         self.notes_manager.saveError.connect(self.saveError)
         self.notes_manager.loadError.connect(self.loadError)
         self.notes_manager.saveSuccess.connect(self.saveSuccess)
-        self.notes_manager.cardBoundsNeedUpdate.connect(self.cardBoundsNeedUpdate)
         
         # Forward model signals
         self.notes_manager.dataChanged.connect(self.dataChanged)
@@ -104,6 +109,15 @@ class MainManager(QAbstractListModel):
         """Handle rows removed from notes manager"""
         self.rowsRemoved.emit(parent, first, last)
     
+    @Slot()
+    def flush_pending_saves(self):
+        """Write any debounced saves immediately (called on application quit)"""
+        self.notes_manager.flush_pending_save()
+        self.notes_manager.wait_for_saves()
+        self.collection_manager.flush_pending_save()
+        self.theme_manager.flush_pending_save()
+        self.config_manager.flush_pending_save()
+    
     # Properties - forward from sub-managers
     @Property('QVariant', notify=configChanged)
     def config(self):
@@ -117,6 +131,21 @@ class MainManager(QAbstractListModel):
     def currentCollection(self):
         return self.collection_manager.currentCollection
     
+    @Property(int, notify=preferredColumnsChanged)
+    def preferredColumns(self):
+        """Card columns for the current collection; QML sizes the cards to fill them"""
+        return self.collection_manager.get_current_collection_preferred_columns()
+    
+    @Property(int, constant=True)
+    def gridRightInset(self):
+        """Space the card grid keeps free right of the cards (margin plus scrollbar)"""
+        return self._RIGHT_MARGIN + self._SCROLLBAR_SPACE
+    
+    @Property(int, constant=True)
+    def cardSpacing(self):
+        """Gap between neighbouring cards"""
+        return self._CARD_SPACING
+    
     @Property(list, notify=notesChanged)
     def notes(self):
         return self.notes_manager.notes
@@ -187,42 +216,42 @@ class MainManager(QAbstractListModel):
     @Slot(str, result=bool)
     def createCollection(self, name):
         # Save current notes before creating new collection
-        if self.collection_manager.currentCollection:
-            self.notes_manager.save_notes()
+        self.notes_manager.flush_pending_save()
         return self.collection_manager.createCollection(name)
 
     @Slot(str)
     def switchCollection(self, name):
         # Save current notes before switching
-        if self.collection_manager.currentCollection:
-            self.notes_manager.save_notes()
+        self.notes_manager.flush_pending_save()
         self.collection_manager.switchCollection(name)
 
     @Slot(str, str)
     def switchCollectionWithSearch(self, name, search_text):
         # Save current notes before switching
-        if self.collection_manager.currentCollection:
-            self.notes_manager.save_notes()
+        self.notes_manager.flush_pending_save()
         # Set search text first, then switch
         self.notes_manager.searchText = search_text
         self.collection_manager.switchCollection(name)
 
     @Slot(str, result=bool)
     def deleteCollection(self, name):
-        # Save current notes before deleting (if it's a different collection)
-        if self.collection_manager.currentCollection and self.collection_manager.currentCollection != name:
-            self.notes_manager.save_notes()
+        # Write pending edits first: if they belong to the deleted collection they
+        # land in its backup instead of recreating the file after it is moved away
+        self.notes_manager.flush_pending_save()
+        self.notes_manager.wait_for_saves()
         return self.collection_manager.deleteCollection(name)
 
     @Slot(str, str, result=bool)
     def renameCollection(self, old_name, new_name):
-        # Save current notes before renaming
-        if self.collection_manager.currentCollection == old_name:
-            self.notes_manager.save_notes()
+        # Save current notes before renaming (pending saves target the old file name)
+        self.notes_manager.flush_pending_save()
+        self.notes_manager.wait_for_saves()
         return self.collection_manager.renameCollection(old_name, new_name)
 
     @Slot(result='QVariant')
     def getCollectionInfo(self):
+        self.notes_manager.flush_pending_save()  # Counts are read from disk
+        self.notes_manager.wait_for_saves()
         return self.collection_manager.getCollectionInfo()
     
     # Theme methods
@@ -283,6 +312,10 @@ class MainManager(QAbstractListModel):
     def cycleFontBackward(self):
         self.font_manager.cycleFontBackward()
 
+    @Slot()
+    def ensureFontsLoaded(self):
+        self.font_manager.ensureFontsLoaded()
+
     @Slot()
     def preloadFonts(self):
         self.font_manager.preloadFonts()
@@ -312,6 +345,11 @@ class MainManager(QAbstractListModel):
     def updateNote(self, note_id, content):
         self.notes_manager.updateNote(note_id, content)
 
+    @Slot(result=bool)
+    def saveNow(self):
+        """Queue the current edits for writing without waiting for the autosave delay (explicit save)"""
+        return self.notes_manager.flush_pending_save()
+
     @Slot(int)
     def deleteNote(self, note_id):
         self.notes_manager.deleteNote(note_id)
@@ -335,6 +373,8 @@ class MainManager(QAbstractListModel):
     # Stats methods
     @Slot(result='QVariant')
     def getOverallStats(self):
+        self.notes_manager.flush_pending_save()  # Stats are read from disk
+        self.notes_manager.wait_for_saves()
         return self.stats_manager.getOverallStats()
     
     # QAbstractListModel interface - delegate to notes_manager
@@ -376,197 +416,86 @@ class MainManager(QAbstractListModel):
         new_height = max(120, min(300, height))
         self.collection_manager.set_current_collection_card_height(new_height)
     
+    def _available_width(self, gridWidth, leftMargin):
+        """Width the card grid can fill"""
+        return gridWidth - leftMargin - self._RIGHT_MARGIN - self._SCROLLBAR_SPACE
+    
+    def _card_width_for_columns(self, availableWidth, columns):
+        """Card width that fits exactly `columns` cards across availableWidth"""
+        if columns == 1:
+            return availableWidth
+        return (availableWidth - (columns - 1) * self._CARD_SPACING) / columns
+    
     @Slot(int, int)
     def optimizeCardWidth(self, gridWidth, leftMargin):
         """Find optimal column count and set cards to fill available width"""
-        try:
-            # Get the number of notes to determine optimal layout
-            totalNotes = len(self.notes_manager.filteredNotes)
-            if totalNotes == 0:
-                return
-            
-            # Simple optimization: find best column count for readability
-            if totalNotes == 1:
-                # Single note gets full width
-                optimalColumns = 1
-            elif totalNotes == 2:
-                # Two notes: prefer 2 columns if each would be reasonably wide
-                rightMargin = 10
-                scrollBarSpace = 10
-                availableWidth = gridWidth - leftMargin - rightMargin - scrollBarSpace
-                spacing = 20
-                twoColWidth = (availableWidth - spacing) / 2
-                optimalColumns = 2 if twoColWidth >= 200 else 1
-            else:
-                # Multiple notes: find optimal balance between columns and readability
-                rightMargin = 10
-                scrollBarSpace = 10
-                availableWidth = gridWidth - leftMargin - rightMargin - scrollBarSpace
-                spacing = 20
-                
-                # Try different column counts and pick the one with best card width
-                optimalColumns = 1
-                bestCardWidth = availableWidth
-                
-                for cols in range(1, min(totalNotes + 1, 6)):  # Try up to 5 columns max
-                    if cols == 1:
-                        cardWidth = availableWidth
-                    else:
-                        cardWidth = (availableWidth - (cols - 1) * spacing) / cols
-                    
-                    # Prefer column counts that give reasonable card widths (150-400px)
-                    if 150 <= cardWidth <= 400:
-                        optimalColumns = cols
-                        bestCardWidth = cardWidth
-                    elif cardWidth > 400 and cols > optimalColumns:
-                        # If card is too wide, more columns might be better
-                        optimalColumns = cols
-                        bestCardWidth = cardWidth
-            
-            # Use setColumnCount to apply the optimal column count (ensures edge-to-edge fill)
-            self.setColumnCount(gridWidth, leftMargin, optimalColumns)
-            
-            # CATCH-ALL: Force cards to fill bounds after optimization
-            self.forceCardFillBounds(gridWidth, leftMargin)
+        # Get the number of notes to determine optimal layout
+        totalNotes = self.notes_manager.noteCount
+        if totalNotes == 0:
+            return
+        
+        availableWidth = self._available_width(gridWidth, leftMargin)
+        
+        # Simple optimization: find best column count for readability
+        if totalNotes == 1:
+            # Single note gets full width
+            optimalColumns = 1
+        elif totalNotes == 2:
+            # Two notes: prefer 2 columns if each would be reasonably wide
+            twoColWidth = self._card_width_for_columns(availableWidth, 2)
+            optimalColumns = 2 if twoColWidth >= 200 else 1
+        else:
+            # Multiple notes: try different column counts, keeping the last that
+            # gives a readable card width
+            optimalColumns = 1
+            for cols in range(1, min(totalNotes + 1, 6)):  # Try up to 5 columns max
+                cardWidth = self._card_width_for_columns(availableWidth, cols)
                 
-        except Exception as e:
-            print(f"✗ Error optimizing card width: {e}")
-
-    @Slot(int, int)
-    def forceCardFillBounds(self, gridWidth, leftMargin):
-        """Public method to force cards to fill available bounds"""
-        try:
-            current_collection = self.collection_manager.currentCollection
-            if not current_collection:
-                return False
-            
-            # Calculate exact available width
-            rightMargin = 10
-            scrollBarSpace = 10
-            availableWidth = gridWidth - leftMargin - rightMargin - scrollBarSpace
-            spacing = 20
-            
-            # Get preferred columns
-            preferredColumns = self.collection_manager.get_current_collection_preferred_columns()
-            
-            # Calculate exact width to fill bounds
-            if preferredColumns == 1:
-                exactWidth = availableWidth
-            else:
-                exactWidth = (availableWidth - (preferredColumns - 1) * spacing) / preferredColumns
-            
-            exactWidth = int(exactWidth)
-            
-            # Force this width regardless of what's currently set
-            current_width = self.collection_manager.get_current_collection_card_width()
-            if exactWidth != current_width:
-                self.collection_manager.set_current_collection_card_width(exactWidth)
-                return True
-            return False
-            
-        except Exception as e:
-            # Don't let errors break the UI
-            return False
+                # Prefer column counts that give reasonable card widths (150-400px)
+                if 150 <= cardWidth <= 400:
+                    optimalColumns = cols
+                elif cardWidth > 400 and cols > optimalColumns:
+                    # If card is too wide, more columns might be better
+                    optimalColumns = cols
+        
+        # Apply through setColumnCount; the grid stretches the cards to fill the width
+        self.setColumnCount(gridWidth, leftMargin, optimalColumns)
 
     @Slot(int, int, int)
     def setColumnCount(self, gridWidth, leftMargin, targetColumns):
-        """Set card width to achieve a specific number of columns"""
-        try:
-            rightMargin = 10
-            scrollBarSpace = 10
-            availableWidth = gridWidth - leftMargin - rightMargin - scrollBarSpace
-            spacing = 20
-            
-            # Calculate width needed for target columns
-            if targetColumns == 1:
-                # Single column fills entire available width
-                newWidth = availableWidth
-            else:
-                newWidth = (availableWidth - (targetColumns - 1) * spacing) / targetColumns
-            
-            # Pure math - no artificial limits when user explicitly sets columns
-            # Cards should always stretch to fill available space exactly
-            newWidth = int(newWidth)
-            
-            # Always allow the column count change (no width validation)
-            current_width = self.collection_manager.get_current_collection_card_width()
-            if current_width != newWidth:
-                self.collection_manager.set_current_collection_card_width(newWidth)
-                # Save the preferred column count
-                self.collection_manager.set_current_collection_preferred_columns(targetColumns)
-            
-            # CATCH-ALL: Force cards to fill bounds regardless
-            self.forceCardFillBounds(gridWidth, leftMargin)
-            return True
-                
-        except Exception as e:
-            print(f"✗ Error setting column count: {e}")
+        """Set the number of card columns (QML derives the card width from it)"""
+        # Nothing to lay out until the grid has real width
+        if gridWidth <= leftMargin + 40 or targetColumns < 1:
             return False
+        
+        # Save the preferred column count; the grid's card width binding follows it
+        self.collection_manager.set_current_collection_preferred_columns(targetColumns)
+        return True
 
     @Slot(int, int)
     def increaseColumns(self, gridWidth, leftMargin):
         """Increase the number of columns by decreasing card width"""
-        try:
-            # Calculate current columns
-            rightMargin = 10
-            scrollBarSpace = 10
-            availableWidth = gridWidth - leftMargin - rightMargin - scrollBarSpace
-            spacing = 20
-            currentWidth = self.collection_manager.get_current_collection_card_width()
-            
-            # Calculate current approximate columns
-            if currentWidth >= availableWidth * 0.9:  # Allow some tolerance
-                # Single column mode
-                currentColumns = 1
-            else:
-                currentColumns = max(1, int((availableWidth + spacing) / (currentWidth + spacing)))
-            
-            # Only limit: can't have more columns than notes (empty columns are useless)
-            totalNotes = len(self.notes_manager.filteredNotes)
-            if totalNotes == 0:
-                return False  # No notes, can't increase columns
-            
-            if currentColumns >= totalNotes:
-                return False  # Already at one column per note
-            
-            targetColumns = currentColumns + 1
-            return self.setColumnCount(gridWidth, leftMargin, targetColumns)
-            
-        except Exception as e:
-            print(f"✗ Error increasing columns: {e}")
+        if gridWidth <= leftMargin + 40:
             return False
+        
+        currentColumns = self.collection_manager.get_current_collection_preferred_columns()
+        
+        # Only limit: can't have more columns than notes (empty columns are useless)
+        if currentColumns >= self.notes_manager.noteCount:
+            return False  # No notes, or already at one column per note
+        
+        return self.setColumnCount(gridWidth, leftMargin, currentColumns + 1)
 
     @Slot(int, int)
     def decreaseColumns(self, gridWidth, leftMargin):
         """Decrease the number of columns by increasing card width"""
-        try:
-            # Calculate current columns
-            rightMargin = 10
-            scrollBarSpace = 10
-            availableWidth = gridWidth - leftMargin - rightMargin - scrollBarSpace
-            spacing = 20
-            currentWidth = self.collection_manager.get_current_collection_card_width()
-            
-            # Calculate current approximate columns
-            if currentWidth >= availableWidth * 0.9:  # Allow some tolerance
-                # Already at single column mode (full width)
-                currentColumns = 1
-            else:
-                currentColumns = max(1, int((availableWidth + spacing) / (currentWidth + spacing)))
-            
-            # If we're already at 1 column but not full width, expand to full width
-            if currentColumns == 1 and currentWidth < availableWidth * 0.9:
-                # Force single column to full width
-                targetColumns = 1
-                return self.setColumnCount(gridWidth, leftMargin, targetColumns)
-            
-            # Don't allow going below 1 column if already at full width
-            if currentColumns <= 1 and currentWidth >= availableWidth * 0.9:
-                return False
-            
-            targetColumns = currentColumns - 1
-            return self.setColumnCount(gridWidth, leftMargin, targetColumns)
-            
-        except Exception as e:
-            print(f"✗ Error decreasing columns: {e}")
-            return False
\ No newline at end of file
+        if gridWidth <= leftMargin + 40:
+            return False
+        
+        currentColumns = self.collection_manager.get_current_collection_preferred_columns()
+        
+        # A single column already fills the full width
+        if currentColumns <= 1:
+            return False
+        
+        return self.setColumnCount(gridWidth, leftMargin, currentColumns - 1)
\ No newline at end of file
@@ -1,11 +1,56 @@
 from PySide6.QtCore import (
-    QAbstractListModel, QModelIndex, Qt, Signal, Slot, Property
+    QAbstractListModel, QModelIndex, QMutex, QRunnable, QThreadPool, Qt, QTimer,
+    Signal, Slot, Property
 )
 import re
 import json
 import os
+from collections import OrderedDict
 from datetime import datetime
 
+from .base_manager import BUFFER_SIZE, json_dumps, json_loads, write_file_atomic
+
+try:
+    import ijson
+except ImportError:  # Optional: without it every collection is parsed in one go
+    ijson = None
+
+# Collection files at least this large are stream-parsed when ijson is available
+STREAM_PARSE_MIN_BYTES = 4 * 1024 * 1024
+
+# Leading markdown header markers stripped from generated titles
+_MD_HEADER_RE = re.compile(r'^#+\s*')
+
+# Number of recently used collections whose validated notes are kept in memory
+LOADED_NOTES_CACHE_SIZE = 8
+
+
+class _SaveRunnable(QRunnable):
+    """Writes the latest serialized notes queued for one file, off the UI thread"""
+    
+    def __init__(self, manager, notes_file):
+        super().__init__()
+        self._manager = manager
+        self._notes_file = notes_file
+    
+    def run(self):
+        # Keep writing until no newer data was queued for this file meanwhile
+        while True:
+            queued = self._manager._take_queued_write(self._notes_file)
+            if queued is None:
+                return
+            data, collection_name, snapshot = queued
+            
+            error = ""
+            try:
+                write_file_atomic(self._notes_file, data)
+            except PermissionError:
+                error = f"Cannot save notes for '{collection_name}' – file is locked or you lack permission."
+            except Exception as e:
+                error = f"Error saving notes for '{collection_name}': {e}"
+            
+            self._manager._writeFinished.emit(self._notes_file, error, snapshot)
+
 
 class NotesManager(QAbstractListModel):
     """Manages individual notes within collections"""
@@ -15,7 +60,7 @@ class NotesManager(QAbstractListModel):
     saveError = Signal(str)
     loadError = Signal(str)
     saveSuccess = Signal()
-    cardBoundsNeedUpdate = Signal()
+    _writeFinished = Signal(str, str, object)  # file, error message, saved notes snapshot
     
     # Role constants
     IdRole       = Qt.UserRole + 1
@@ -23,6 +68,15 @@ class NotesManager(QAbstractListModel):
     ContentRole  = Qt.UserRole + 3
     CreatedRole  = Qt.UserRole + 4
     ModifiedRole = Qt.UserRole + 5
+    
+    # role -> note key so data() is a single table lookup (load_notes guarantees every key)
+    _ROLE_FIELDS = {
+        IdRole:       "id",
+        TitleRole:    "title",
+        ContentRole:  "content",
+        CreatedRole:  "created",
+        ModifiedRole: "modified",
+    }
 
     def roleNames(self):
         return {
@@ -40,20 +94,11 @@ class NotesManager(QAbstractListModel):
         if not index.isValid() or index.row() >= len(self._filtered_notes):
             return None
         
-        note = self._filtered_notes[index.row()]
-        
-        if role == self.IdRole:
-            return note.get("id", -1)
-        elif role == self.TitleRole:
-            return note.get("title", "")
-        elif role == self.ContentRole:
-            return note.get("content", "")
-        elif role == self.CreatedRole:
-            return note.get("created", "")
-        elif role == self.ModifiedRole:
-            return note.get("modified", "")
-        
-        return None
+        key = self._ROLE_FIELDS.get(role)
+        if key is None:
+            return None
+        # Rows are newest first; the lists are stored oldest first
+        return self._filtered_notes[-1 - index.row()][key]
     
     def __init__(self, collection_manager, stats_manager):
         super().__init__()
@@ -61,12 +106,39 @@ class NotesManager(QAbstractListModel):
         self.collection_manager = collection_manager
         self.stats_manager = stats_manager
         
-        # Notes state (per collection)
+        # Notes state (per collection). Lists are kept oldest first so new notes
+        # are appended; the model and properties expose them newest first.
         self._notes = []
-        self._filtered_notes = []
+        self._notes_by_id = {}  # id -> note dict (the same objects as in _notes)
+        # id -> (lowercased title, lowercased content, note) for search, in _notes order
+        self._lower_cache = {}
+        self._filtered_notes = self._notes  # The same list as _notes until a search narrows it
+        self._filter_active = False
+        self._filtered_index_by_id = {}  # id -> position in _filtered_notes (not the view row)
+        self._filter_needle = None  # Plain-text needle _filtered_notes was built from, if any
         self._next_id = 0
         self._search_text = ""
-        self._search_regex = None
+        
+        # Edits are written after autoSaveInterval of quiet, to the collection
+        # they were made in (which may no longer be current when the timer fires)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.flush_pending_save)
+        self._pending_save_collection = None
+        
+        # Serialized notes are written on the pool; file path -> (bytes, collection,
+        # snapshot) waiting for its writer, so rapid saves coalesce to the latest
+        self._save_pool = QThreadPool.globalInstance()
+        self._write_mutex = QMutex()
+        self._queued_writes = {}
+        self._writes_in_flight = set()
+        self._writeFinished.connect(self._on_write_finished)
+        
+        # file path -> ((mtime_ns, size), notes, next_id, lower cache), least recent first.
+        # Entries share the live lists, so an edit drops the entry for its file, and a
+        # finished write only re-adds it if no edit happened since the data was serialized.
+        self._loaded_notes_cache = OrderedDict()
+        self._edit_count = 0  # Bumped on every change to the current notes
         
         # Connect to collection changes
         self.collection_manager.currentCollectionChanged.connect(self.load_notes)
@@ -79,36 +151,33 @@ class NotesManager(QAbstractListModel):
         """Read JSON file with error handling"""
         try:
             if os.path.exists(filepath):
-                with open(filepath, 'r', encoding='utf-8') as f:
+                with open(filepath, 'rb', buffering=BUFFER_SIZE) as f:
                     content = f.read().strip()
                     if not content:
                         return default_value
-                    return json.loads(content)
+                    return json_loads(content)
             return default_value
-        except json.JSONDecodeError:
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
             self.loadError.emit(f"File {filepath} is corrupted. Creating backup...")
             return default_value
         except Exception as e:
             self.loadError.emit(f"Error reading file {filepath}: {e}")
             return default_value
     
-    def atomic_write_json(self, data, filepath):
-        """Write JSON data atomically using temporary file"""
+    def read_notes_file(self, filepath):
+        """Read a collection's notes, stream-parsing large files to avoid holding the whole text"""
+        if ijson is None or not os.path.exists(filepath) or os.path.getsize(filepath) < STREAM_PARSE_MIN_BYTES:
+            return self.read_json_file(filepath, [])
+        
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            
-            # Use temporary file for atomic write
-            temp_file = f"{filepath}.tmp"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            # Atomic rename
-            os.replace(temp_file, filepath)
-            return True
+            with open(filepath, 'rb', buffering=BUFFER_SIZE) as f:
+                return list(ijson.items(f, 'item', use_float=True))
+        except ijson.JSONError:
+            self.loadError.emit(f"File {filepath} is corrupted. Creating backup...")
+            return []
         except Exception as e:
-            self.saveError.emit(f"Error writing file {filepath}: {e}")
-            return False
+            self.loadError.emit(f"Error reading file {filepath}: {e}")
+            return []
     
     def generate_title(self, content):
         """Generate a title from the first line of content"""
@@ -119,7 +188,7 @@ class NotesManager(QAbstractListModel):
         first_line = content.split('\n')[0].strip()
         
         # Remove any markdown headers
-        first_line = re.sub(r'^#+\s*', '', first_line)
+        first_line = _MD_HEADER_RE.sub('', first_line)
         
         # Limit to reasonable title length
         if len(first_line) > 50:
@@ -129,11 +198,21 @@ class NotesManager(QAbstractListModel):
     
     def load_notes(self):
         """Load notes for current collection"""
+        # Edits still waiting to be written belong to the notes being replaced,
+        # and the file must not change under the read below
+        self.flush_pending_save()
+        self.wait_for_saves()
+        
         current_collection = self.collection_manager.currentCollection
         
         if not current_collection:
             self._notes = []
-            self._filtered_notes = []
+            self._notes_by_id = {}
+            self._lower_cache = {}
+            self._filtered_notes = self._notes
+            self._filter_active = False
+            self._filtered_index_by_id = {}
+            self._filter_needle = None
             self._next_id = 0
             self.beginResetModel()
             self.endResetModel()
@@ -143,79 +222,184 @@ class NotesManager(QAbstractListModel):
 
         notes_file = self.collection_manager.get_collection_file_path(current_collection)
         
+        file_key = self._file_key(notes_file)
+        cached = self._loaded_notes_cache.get(notes_file)
+        
         try:
-            notes_data = self.read_json_file(notes_file, [])
-            
-            if not notes_data:
-                self._notes = []
-                self._filtered_notes = []
-                self._next_id = 0
+            if cached is not None and file_key is not None and cached[0] == file_key:
+                # Unchanged since it was last loaded or saved: skip parsing and validation
+                self._loaded_notes_cache.move_to_end(notes_file)
+                _, self._notes, self._next_id, self._lower_cache = cached
             else:
-                # Validate note structure and find highest ID
-                max_id = -1
-                valid_notes = []
-                for note in notes_data:
-                    if isinstance(note, dict) and all(key in note for key in ['id', 'title', 'content']):
-                        # Add missing timestamps
-                        if 'created' not in note:
-                            note['created'] = datetime.now().isoformat()
-                        if 'modified' not in note:
-                            note['modified'] = note['created']
-                        valid_notes.append(note)
-                        max_id = max(max_id, note['id'])
+                notes_data = self.read_notes_file(notes_file)
                 
-                self._notes = valid_notes
-                self._next_id = max_id + 1
-                self._filtered_notes = self._notes.copy()
+                if not notes_data:
+                    self._notes = []
+                    self._next_id = 0
+                else:
+                    # Validate note structure and find highest ID
+                    max_id = -1
+                    valid_notes = []
+                    seen_ids = set()
+                    duplicates = []
+                    for note in notes_data:
+                        if isinstance(note, dict) and all(key in note for key in ['id', 'title', 'content']):
+                            # Add missing timestamps
+                            if 'created' not in note:
+                                note['created'] = datetime.now().isoformat()
+                            if 'modified' not in note:
+                                note['modified'] = note['created']
+                            valid_notes.append(note)
+                            max_id = max(max_id, note['id'])
+                            if note['id'] in seen_ids:
+                                duplicates.append(note)
+                            seen_ids.add(note['id'])
+                    
+                    # Ids must be unique for lookups by id; renumber any repeats
+                    for note in duplicates:
+                        max_id += 1
+                        note['id'] = max_id
+                    
+                    # Files list the newest note first
+                    valid_notes.reverse()
+                    self._notes = valid_notes
+                    self._next_id = max_id + 1
+                
+                self._lower_cache = {}
+                for note in self._notes:
+                    self._cache_search_text(note)
+                self._remember_notes(notes_file, file_key)
                 
         except Exception as e:
             self.loadError.emit(f"Error loading notes for '{current_collection}': {str(e)}")
             self._notes = []
-            self._filtered_notes = []
+            self._lower_cache = {}
             self._next_id = 0
         finally:
+            self._filtered_notes = self._notes
+            self._filter_active = False
+            self._filter_needle = None
+            self._notes_by_id = {note["id"]: note for note in self._notes}
+            self._reindex_filtered()
+            
             # Reset the model to reflect the loaded notes
             self.beginResetModel()
             self.endResetModel()
             self.notesChanged.emit()
             self.filteredNotesChanged.emit()
-            
-            # Trigger card bounds update when notes are loaded
-            self.cardBoundsNeedUpdate.emit()
 
-    def save_notes(self):
-        """Save notes for current collection"""
-        current_collection = self.collection_manager.currentCollection
+    def _file_key(self, filepath):
+        """(mtime_ns, size) identifying a file's current contents, or None if it is missing"""
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _remember_notes(self, notes_file, file_key, snapshot=None):
+        """Cache the live notes (or a saved snapshot of them) as the validated contents of notes_file"""
+        if file_key is None:
+            return
+        if snapshot is None:
+            snapshot = (self._notes, self._next_id, self._lower_cache)
+        self._loaded_notes_cache[notes_file] = (file_key, *snapshot)
+        self._loaded_notes_cache.move_to_end(notes_file)
+        while len(self._loaded_notes_cache) > LOADED_NOTES_CACHE_SIZE:
+            self._loaded_notes_cache.popitem(last=False)
+    
+    def save_notes(self, collection_name=None):
+        """Save notes for the given collection (default: the current one)"""
+        # This write covers any pending deferred save
+        self._save_timer.stop()
+        self._pending_save_collection = None
         
-        if not current_collection:
+        collection_name = collection_name or self.collection_manager.currentCollection
+        
+        if not collection_name:
             return False
 
-        notes_file = self.collection_manager.get_collection_file_path(current_collection)
+        notes_file = self.collection_manager.get_collection_file_path(collection_name)
         
         try:
-            if self.atomic_write_json(self._notes, notes_file):
-                self.saveSuccess.emit()
-                return True
-            else:
-                return False
-
-        except PermissionError:
-            msg = f"Cannot save notes for '{current_collection}' – file is locked or you lack permission."
-            self.saveError.emit(msg)
-            return False
+            # Serialize here so the worker never touches the live notes (newest first on disk)
+            data = json_dumps(self._notes[::-1])
         except Exception as e:
-            msg = f"Error saving notes for '{current_collection}': {e}"
+            msg = f"Error saving notes for '{collection_name}': {e}"
             self.saveError.emit(msg)
             return False
+        
+        snapshot = (self._notes, self._next_id, self._lower_cache, self._edit_count)
+        self._write_mutex.lock()
+        try:
+            self._queued_writes[notes_file] = (data, collection_name, snapshot)
+            # A writer already running for this file picks up the newer data itself
+            start_writer = notes_file not in self._writes_in_flight
+            self._writes_in_flight.add(notes_file)
+        finally:
+            self._write_mutex.unlock()
+        
+        if start_writer:
+            self._save_pool.start(_SaveRunnable(self, notes_file))
+        return True
+    
+    def _take_queued_write(self, notes_file):
+        """Hand the latest queued data for notes_file to its writer (None when done)"""
+        self._write_mutex.lock()
+        try:
+            queued = self._queued_writes.pop(notes_file, None)
+            if queued is None:
+                self._writes_in_flight.discard(notes_file)
+            return queued
+        finally:
+            self._write_mutex.unlock()
+    
+    def _on_write_finished(self, notes_file, error, snapshot):
+        """Report a completed background write"""
+        if error:
+            # The file no longer matches whatever notes were cached for it
+            self._loaded_notes_cache.pop(notes_file, None)
+            self.saveError.emit(error)
+            return
+        # The file now matches the saved notes, so a revisit can reuse them, unless
+        # they were edited after being serialized (a later save covers those)
+        *saved, edit_count = snapshot
+        if edit_count == self._edit_count:
+            self._remember_notes(notes_file, self._file_key(notes_file), saved)
+        else:
+            self._loaded_notes_cache.pop(notes_file, None)
+        self.saveSuccess.emit()
+    
+    def _notes_edited(self):
+        """Record a change to the current notes, which the cached copy of their file no longer matches"""
+        self._edit_count += 1
+        notes_file = self.collection_manager.get_collection_file_path(self.collection_manager.currentCollection)
+        self._loaded_notes_cache.pop(notes_file, None)
+    
+    def wait_for_saves(self):
+        """Block until every queued background write has reached the disk"""
+        self._save_pool.waitForDone()
+    
+    def schedule_save(self):
+        """Save after autoSaveInterval of quiet, coalescing rapid edits into one write"""
+        self._pending_save_collection = self.collection_manager.currentCollection
+        interval = self.collection_manager.config_manager.get_value("autoSaveInterval", 1000)
+        self._save_timer.start(interval)
+    
+    @Slot(result=bool)
+    def flush_pending_save(self):
+        """Write a deferred save immediately, if one is pending; False if it could not be queued"""
+        if self._pending_save_collection is not None:
+            return self.save_notes(self._pending_save_collection)
+        return True
     
     # Properties
     @Property(list, notify=notesChanged)
     def notes(self):
-        return self._notes
+        return self._notes[::-1]
     
     @Property(list, notify=filteredNotesChanged)
     def filteredNotes(self):
-        return self._filtered_notes
+        return self._filtered_notes[::-1]
     
     @Property(str, notify=filteredNotesChanged)
     def searchText(self):
@@ -240,26 +424,111 @@ class NotesManager(QAbstractListModel):
     def setSearchText(self, text):
         self.searchText = text
     
+    def _reindex_filtered(self, start=0):
+        """Refresh the id -> position index for filtered notes from position start onwards"""
+        index = self._filtered_index_by_id
+        if start == 0:
+            index.clear()
+        filtered = self._filtered_notes
+        for row in range(start, len(filtered)):
+            index[filtered[row]["id"]] = row
+    
+    def _apply_filter(self, filtered):
+        """Replace the visible notes, emitting row removals/insertions instead of a reset"""
+        if filtered is self._notes and not self._filter_active:
+            return  # Already showing every note
+        
+        if self._filter_active:
+            rows = self._filtered_notes
+        else:
+            # Stop sharing _notes before the rows are narrowed in place
+            rows = self._filtered_notes = list(self._notes)
+        
+        # Both lists are drawn from _notes in order, so one merge walk in view
+        # (newest first) order finds every run of rows to drop or add. Ranks are
+        # keyed by object identity, which stays unique even if a file repeats a note id.
+        old = rows[::-1]
+        filtered = filtered[::-1]
+        rank = {id(note): k for k, note in enumerate(reversed(self._notes))}
+        changed = False
+        row = i = j = 0
+        while i < len(old) or j < len(filtered):
+            if i < len(old) and j < len(filtered) and old[i] is filtered[j]:
+                i += 1
+                j += 1
+                row += 1
+            elif j == len(filtered) or (i < len(old) and rank[id(old[i])] < rank[id(filtered[j])]):
+                # Run of rows that no longer match
+                start = i
+                while i < len(old) and (j == len(filtered) or rank[id(old[i])] < rank[id(filtered[j])]):
+                    i += 1
+                end = len(rows) - row  # Stored position just past view row `row`
+                self.beginRemoveRows(QModelIndex(), row, row + i - start - 1)
+                del rows[end - (i - start):end]
+                self.endRemoveRows()
+                changed = True
+            else:
+                # Run of newly matching rows
+                start = j
+                while j < len(filtered) and (i == len(old) or rank[id(filtered[j])] < rank[id(old[i])]):
+                    j += 1
+                end = len(rows) - row
+                self.beginInsertRows(QModelIndex(), row, row + j - start - 1)
+                rows[end:end] = filtered[start:j][::-1]
+                self.endInsertRows()
+                row += j - start
+                changed = True
+        
+        # Showing every note again: go back to sharing _notes instead of a copy
+        self._filter_active = len(rows) != len(self._notes)
+        if not self._filter_active:
+            self._filtered_notes = self._notes
+        
+        if changed:
+            self._reindex_filtered()
+    
+    def _cache_search_text(self, note):
+        """Store the lowercased title and content that search matches against, with the note"""
+        title = note["title"]
+        content = note["content"]
+        title_lower = title.lower()
+        content_lower = content.lower()
+        # Text that is already lowercase shares the note's string instead of a copy
+        self._lower_cache[note["id"]] = (
+            title if title_lower == title else title_lower,
+            content if content_lower == content else content_lower,
+            note,
+        )
+    
+    def _search_matcher(self):
+        """Return a predicate(title_lower, content_lower) for the current search, or None when not searching"""
+        # Surrounding whitespace in the box (e.g. a trailing space) shouldn't hide matches
+        needle = self._search_text.strip().lower()
+        if not needle:
+            return None
+        return lambda title, content: needle in title or needle in content
+    
     @Slot()
     def updateFilteredNotes(self):
         """Update filtered notes and properly notify the model"""
-        self.beginResetModel()
-        
-        if self._search_text.strip():
-            search_pattern = re.compile(re.escape(self._search_text), re.IGNORECASE)
-            self._filtered_notes = [
-                note for note in self._notes
-                if (search_pattern.search(note.get("title", "")) or 
-                    search_pattern.search(note.get("content", "")))
-            ]
+        # Same needle as _search_matcher; tested inline below rather than per call
+        needle = self._search_text.strip().lower() or None
+        if needle:
+            # Extending the previous query can only narrow the result, so only the
+            # rows still visible need rechecking (they keep _notes order)
+            lower = self._lower_cache
+            previous = self._filter_needle
+            if previous and previous in needle:
+                entries = [lower[note["id"]] for note in self._filtered_notes]
+            else:
+                entries = lower.values()  # Kept in _notes order
+            filtered = [note for title, content, note in entries if needle in title or needle in content]
         else:
-            self._filtered_notes = list(self._notes)
+            filtered = self._notes
         
-        self.endResetModel()
+        self._filter_needle = needle
+        self._apply_filter(filtered)
         self.filteredNotesChanged.emit()
-        
-        # Trigger card bounds recalculation when filter changes number of visible notes
-        self.cardBoundsNeedUpdate.emit()
     
     @Slot(str, result=int)
     def createNote(self, content):
@@ -283,27 +552,35 @@ class NotesManager(QAbstractListModel):
             "modified": now
         }
         
-        # Add to notes list
-        self._notes.insert(0, new_note)
+        self._notes_by_id[note_id] = new_note
+        self._cache_search_text(new_note)
         
-        # Update filtered notes
-        if self._search_text.strip():
-            search_pattern = re.compile(re.escape(self._search_text), re.IGNORECASE)
-            if (search_pattern.search(title) or search_pattern.search(content)):
-                self.beginInsertRows(QModelIndex(), 0, 0)
-                self._filtered_notes.insert(0, new_note)
-                self.endInsertRows()
+        # A search shows only matching notes, even when every note so far matched it
+        matches = self._search_matcher()
+        if matches is None:
+            visible = True
         else:
+            title_lower, content_lower, _ = self._lower_cache[note_id]
+            visible = matches(title_lower, content_lower)
+            if not visible and not self._filter_active:
+                # Stop sharing _notes before it gains a note the view must not show
+                self._filtered_notes = list(self._notes)
+                self._filter_active = True
+        
+        # Appending keeps existing positions valid; the new note is view row 0
+        if visible:
             self.beginInsertRows(QModelIndex(), 0, 0)
-            self._filtered_notes.insert(0, new_note)
+        self._notes.append(new_note)
+        if visible:
+            if self._filter_active:
+                self._filtered_notes.append(new_note)
+            self._filtered_index_by_id[note_id] = len(self._filtered_notes) - 1
             self.endInsertRows()
         
-        # Save to current collection
-        self.save_notes()
-        self.notesChanged.emit()
-        
-        # Trigger card bounds recalculation for new note
-        self.cardBoundsNeedUpdate.emit()
+        self._notes_edited()
+        # Save to current collection once edits settle
+        self.schedule_save()
+        self.notesChanged.emit()  # totalNotesInCollection
         return note_id
     
     @Slot(int, str)
@@ -314,29 +591,28 @@ class NotesManager(QAbstractListModel):
         if not current_collection:
             return
             
-        for i, note in enumerate(self._notes):
-            if note["id"] == note_id:
-                if note["content"] != content:
-                    note["content"] = content
-                    note["title"] = self.generate_title(content)
-                    note["modified"] = datetime.now().isoformat()
-                    
-                    # Find in filtered notes
-                    for j, filtered_note in enumerate(self._filtered_notes):
-                        if filtered_note["id"] == note_id:
-                            self._filtered_notes[j] = note
-                            # Notify model of change
-                            idx = self.index(j)
-                            self.dataChanged.emit(idx, idx, [
-                                self.TitleRole, 
-                                self.ContentRole, 
-                                self.ModifiedRole
-                            ])
-                            break
-                    
-                    # Save to current collection
-                    self.save_notes()
-                break
+        note = self._notes_by_id.get(note_id)
+        if note is not None and note["content"] != content:
+            note["content"] = content
+            note["title"] = self.generate_title(content)
+            note["modified"] = datetime.now().isoformat()
+            self._cache_search_text(note)
+            # An edited note may now match a search it was filtered out of
+            self._filter_needle = None
+            
+            # Notify model of change if the note is visible
+            j = self._filtered_index_by_id.get(note_id)
+            if j is not None:
+                idx = self.index(len(self._filtered_notes) - 1 - j)
+                self.dataChanged.emit(idx, idx, [
+                    self.TitleRole, 
+                    self.ContentRole, 
+                    self.ModifiedRole
+                ])
+            
+            self._notes_edited()
+            # Save to current collection once edits settle
+            self.schedule_save()
     
     @Slot(int)
     def deleteNote(self, note_id):
@@ -346,47 +622,53 @@ class NotesManager(QAbstractListModel):
         if not current_collection:
             return
             
-        # Find and remove from main list
-        for i, note in enumerate(self._notes):
-            if note["id"] == note_id:
-                self._notes.pop(i)
-                break
-        
-        # Find and remove from filtered list
-        for i, note in enumerate(self._filtered_notes):
-            if note["id"] == note_id:
-                self.beginRemoveRows(QModelIndex(), i, i)
-                self._filtered_notes.pop(i)
-                self.endRemoveRows()
-                break
+        note = self._notes_by_id.pop(note_id, None)
+        if note is None:
+            return
+        self._lower_cache.pop(note_id, None)
         
-        # Save to current collection
-        self.save_notes()
-        self.notesChanged.emit()
+        # Remove from the visible rows, shifting the newer notes down one position,
+        # and from _notes (the same list when no filter is active)
+        i = self._filtered_index_by_id.pop(note_id, None)
+        if i is not None:
+            row = len(self._filtered_notes) - 1 - i
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._filtered_notes.pop(i)
+            if self._filter_active:
+                self._remove_from_notes(note)
+            self._reindex_filtered(i)
+            self.endRemoveRows()
+        else:
+            self._remove_from_notes(note)
         
-        # Trigger card bounds recalculation after deletion
-        self.cardBoundsNeedUpdate.emit()
+        self._notes_edited()
+        # Save to current collection once edits settle
+        self.schedule_save()
+        self.notesChanged.emit()  # totalNotesInCollection
+    
+    def _remove_from_notes(self, note):
+        """Remove note from _notes, finding it by identity rather than comparing dicts"""
+        notes = self._notes
+        for i in range(len(notes) - 1, -1, -1):  # Recent notes are the likeliest to go
+            if notes[i] is note:
+                del notes[i]
+                return
     
     @Slot(int, result='QVariant')
     def getNote(self, note_id):
-        for note in self._notes:
-            if note["id"] == note_id:
-                return note
-        return {}
+        return self._notes_by_id.get(note_id, {})
     
     @Slot(int, result='QVariant')
     def getNoteById(self, note_id):
         """Get note by ID from filtered notes"""
-        for note in self._filtered_notes:
-            if note.get("id") == note_id:
-                return note
-        return None
+        i = self._filtered_index_by_id.get(note_id)
+        return self._filtered_notes[i] if i is not None else None
 
     @Slot(int, result='QVariant')
     def getNoteByIndex(self, index):
         """Get note by index from filtered notes"""
         if 0 <= index < len(self._filtered_notes):
-            return self._filtered_notes[index]
+            return self._filtered_notes[-1 - index]
         return None
     
     @Slot(int, result='QVariant')
@@ -1,10 +1,144 @@
 from PySide6.QtCore import Signal, Slot
-from .base_manager import BaseManager
-import json
+from .base_manager import BaseManager, BUFFER_SIZE
 import os
 import re
+from bisect import bisect_left
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
 
+try:
+    import ijson
+except ImportError:  # Optional: without it each collection is parsed in one go
+    ijson = None
+
+
+# Lines opening with a straight or curly quote, after any leading indentation
+_DIALOGUE_RE = re.compile(r'^[^\S\n]*["\'\u201C\u2018]', re.MULTILINE)
+
+# Sentence terminator runs. The run length is bounded so the split stays linear
+# even if the class is later extended with alternatives (ellipses, abbreviations)
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]{1,16}')
+
+# A blank-line break and the rest of its whitespace run. On stripped text each match
+# separates two paragraphs, so paragraphs are counted without splitting them out
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\n\s*')
+
+# Number of notes whose text metrics are kept for reopening their stats
+NOTE_METRICS_CACHE_SIZE = 256
+
+# Common articles/prepositions left out of the most common words
+_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'this', 'that', 'these', 'those'})
+
+# Maps the punctuation the tokenizer ignores to spaces, so one split() yields clean words
+_PUNCT_TRANS = str.maketrans(dict.fromkeys('.,!?;:"()[]{}', ' '))
+
+# Stats for a note with no words; copied and filled in per call
+_EMPTY_STATS = {
+    "chars": 0,
+    "charsNoSpaces": 0,
+    "words": 0,
+    "uniqueWords": 0,
+    "lines": 0,
+    "paragraphs": 0,
+    "sentences": 0,
+    "dialogueLines": 0,
+    "averageWordLength": 0,
+    "averageSentenceLength": 0,
+    "lexicalDiversity": 0,
+    "readingTimeMinutes": 0,
+    "speakingTimeMinutes": 0,
+    "estimatedWritingTimeMinutes": 0,
+    "mostCommonWords": [],
+}
+
+
+def _text_metrics(content):
+    """Compute every content-derived note statistic in one call.
+    
+    Kept free of Qt and note metadata so the whole counting kernel has a
+    single fixed input (the text) and output (the metrics dict).
+    """
+    char_count = len(content)
+    newlines = content.count('\n')
+    char_count_no_spaces = char_count - content.count(' ')
+    
+    # Blank notes: skip tokenizing and scanning entirely
+    stripped = content.strip()
+    if not stripped:
+        metrics = dict(_EMPTY_STATS)
+        metrics.update({
+            "chars": char_count,
+            "charsNoSpaces": char_count_no_spaces,
+            "lines": newlines + 1 if content else 0,
+            "mostCommonWords": []
+        })
+        return metrics
+    
+    # Basic stats
+    word_count = len(content.split())
+    line_count = newlines + 1
+    if newlines == 0:
+        # Single line: exactly one paragraph, no need to split
+        paragraph_count = 1
+    else:
+        paragraph_count = 1 + len(_PARAGRAPH_BREAK_RE.findall(stripped))
+    
+    # Literary-focused stats
+    sentence_count = len([s for s in _SENTENCE_SPLIT_RE.split(content) if s.strip()])
+    
+    # Punctuation-free, lowercased tokens from one translate + split pass
+    tokens = content.translate(_PUNCT_TRANS).lower().split()
+    token_count = len(tokens)
+    
+    # Average word length (helpful for readability)
+    avg_word_length = sum(map(len, tokens)) / token_count if token_count else 0
+    
+    # Average sentence length
+    avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
+    
+    # Dialogue detection (rough estimate)
+    if newlines == 0:
+        dialogue_lines = 1 if _DIALOGUE_RE.match(content) else 0
+    else:
+        dialogue_lines = sum(1 for _ in _DIALOGUE_RE.finditer(content))
+    
+    # Unique words count (vocabulary richness)
+    unique_words = len(set(tokens))
+    lexical_diversity = unique_words / token_count if token_count else 0
+    
+    # Most common words (excluding common articles/prepositions)
+    # Filter and count in the same pass over the tokens
+    word_freq = Counter(word for word in tokens if len(word) > 2 and word not in _STOP_WORDS)
+    
+    # Get top 3 most frequent words (a partial heap selection, ties in first-seen
+    # order) - convert tuples to lists for QML compatibility
+    most_common = [[word, count] for word, count in word_freq.most_common(3)]
+    
+    # Reading time estimates
+    reading_time_minutes = word_count / 200 if word_count > 0 else 0  # Silent reading
+    speaking_time_minutes = word_count / 150 if word_count > 0 else 0  # Speaking pace
+    
+    # Writing time estimate (rough - varies greatly by person and content type)
+    # Assume 20-30 words per minute for thoughtful writing
+    estimated_writing_time = word_count / 25 if word_count > 0 else 0
+    
+    return {
+        "chars": char_count,
+        "charsNoSpaces": char_count_no_spaces,
+        "words": word_count,
+        "uniqueWords": unique_words,
+        "lines": line_count,
+        "paragraphs": paragraph_count,
+        "sentences": sentence_count,
+        "dialogueLines": dialogue_lines,
+        "averageWordLength": round(avg_word_length, 1),
+        "averageSentenceLength": round(avg_sentence_length, 1),
+        "lexicalDiversity": round(lexical_diversity, 3),
+        "readingTimeMinutes": reading_time_minutes,
+        "speakingTimeMinutes": speaking_time_minutes,
+        "estimatedWritingTimeMinutes": estimated_writing_time,
+        "mostCommonWords": most_common
+    }
 
 class StatsManager(BaseManager):
     """Manages statistics and analytics for notes"""
@@ -12,23 +146,111 @@ class StatsManager(BaseManager):
     def __init__(self, collection_manager):
         super().__init__()
         self.collection_manager = collection_manager
+        
+        # (collection, note id) -> ((length, hash) of content, metrics) for
+        # unchanged-note reuse, least recently used first
+        self._note_metrics_cache = OrderedDict()
+        
+        # collection file -> counts for its last seen [mtime_ns, size], persisted
+        # across runs; loaded on the first getOverallStats call
+        self._stats_cache_file = "data/stats_cache.json"
+        self._collection_stats_cache = None
+    
+    def _load_stats_cache(self):
+        """Per-collection stats persisted by earlier runs, read on first use"""
+        if self._collection_stats_cache is None:
+            cache = self.read_json_file(self._stats_cache_file, {})
+            self._collection_stats_cache = cache if isinstance(cache, dict) else {}
+        return self._collection_stats_cache
+    
+    def _iter_notes(self, collection_file):
+        """Yield a collection file's notes, streamed one at a time when ijson is available"""
+        if ijson is not None:
+            with open(collection_file, 'rb', buffering=BUFFER_SIZE) as f:
+                yield from ijson.items(f, 'item', use_float=True)
+            return
+        notes = self.read_json_file(collection_file, [])
+        if isinstance(notes, list):
+            yield from notes
+    
+    def _scan_collection(self, collection_file, file_key):
+        """Count one collection file's notes, words, chars, sentences and paragraphs.
+        
+        Creation times are kept sorted (as timestamps) rather than counted, so the
+        this-week/this-month figures stay correct when the cached entry is reused later.
+        """
+        entry = {
+            "key": file_key,
+            "notes": 0,
+            "words": 0,
+            "chars": 0,
+            "sentences": 0,
+            "paragraphs": 0,
+            "created": [],
+        }
+        note_count = words_count = chars_count = sentences = paragraphs = 0
+        created = []
+        for note in self._iter_notes(collection_file):
+            note_count += 1
+            if isinstance(note, dict) and 'content' in note:
+                content = note['content']
+                chars_count += len(content)
+                
+                # Blank notes add no words, sentences or paragraphs
+                stripped = content.strip()
+                if stripped:
+                    words_count += len(content.split())
+                    
+                    # Count sentences and paragraphs
+                    sentences += sum(1 for s in _SENTENCE_SPLIT_RE.split(content) if s.strip())
+                    if '\n' not in content:
+                        paragraphs += 1  # Single line: one paragraph
+                    else:
+                        paragraphs += 1 + len(_PARAGRAPH_BREAK_RE.findall(stripped))
+                
+                # Record creation date for the recent-notes counts
+                if 'created' in note:
+                    try:
+                        created_date = datetime.fromisoformat(note['created'])
+                        if created_date.tzinfo is None:  # Only local times compare with now()
+                            created.append(created_date.timestamp())
+                    except:
+                        pass
+        
+        created.sort()
+        entry.update({
+            "notes": note_count,
+            "words": words_count,
+            "chars": chars_count,
+            "sentences": sentences,
+            "paragraphs": paragraphs,
+            "created": created,
+        })
+        return entry
     
     @Slot(result='QVariant')
     def getOverallStats(self):
         """Get overall statistics across all collections"""
-        total_notes = 0
-        total_words = 0
-        total_chars = 0
         total_sentences = 0
         total_paragraphs = 0
         notes_this_week = 0
         notes_this_month = 0
-        collection_stats = []
+        
+        # Per-collection counts kept as parallel columns; rows are built once at the end
+        names = []
+        notes_counts = []
+        words_counts = []
+        chars_counts = []
         
         # Calculate date thresholds
         now = datetime.now()
-        week_ago = now - timedelta(days=7)
-        month_ago = now - timedelta(days=30)
+        week_ago = (now - timedelta(days=7)).timestamp()
+        month_ago = (now - timedelta(days=30)).timestamp()
+        
+        # Collections whose file is unchanged (same mtime and size) reuse their counts
+        cache = self._load_stats_cache()
+        entries = {}
+        cache_changed = False
         
         for collection_name in self.collection_manager.collections:
             collection_file = self.collection_manager.get_collection_file_path(collection_name)
@@ -37,51 +259,57 @@ class StatsManager(BaseManager):
             chars_count = 0
             
             try:
-                if os.path.exists(collection_file):
-                    notes = self.read_json_file(collection_file, [])
-                    if isinstance(notes, list):
-                        notes_count = len(notes)
-                        for note in notes:
-                            if isinstance(note, dict) and 'content' in note:
-                                content = note['content']
-                                chars_count += len(content)
-                                words_in_note = len(content.split()) if content.strip() else 0
-                                words_count += words_in_note
-                                
-                                # Count sentences and paragraphs
-                                total_sentences += len([s for s in re.split(r'[.!?]+', content) if s.strip()])
-                                total_paragraphs += len([p for p in content.split('\n\n') if p.strip()])
-                                
-                                # Check creation date for recent notes
-                                if 'created' in note:
-                                    try:
-                                        created_date = datetime.fromisoformat(note['created'])
-                                        if created_date >= week_ago:
-                                            notes_this_week += 1
-                                        if created_date >= month_ago:
-                                            notes_this_month += 1
-                                    except:
-                                        pass
-                                        
-            except Exception as e:
-                pass  # Error reading collection
+                stat = os.stat(collection_file)
+            except OSError:
+                stat = None  # No file yet
             
-            collection_stats.append({
-                "name": collection_name,
-                "notes": notes_count,
-                "words": words_count,
-                "chars": chars_count,
-                "isCurrent": collection_name == self.collection_manager.currentCollection
-            })
+            if stat is not None:
+                try:
+                    file_key = [stat.st_mtime_ns, stat.st_size]
+                    entry = cache.get(collection_file)
+                    if entry is None or entry.get("key") != file_key:
+                        entry = self._scan_collection(collection_file, file_key)
+                        cache_changed = True
+                    entries[collection_file] = entry
+                    
+                    notes_count = entry["notes"]
+                    words_count = entry["words"]
+                    chars_count = entry["chars"]
+                    total_sentences += entry["sentences"]
+                    total_paragraphs += entry["paragraphs"]
+                    
+                    created = entry["created"]
+                    notes_this_week += len(created) - bisect_left(created, week_ago)
+                    notes_this_month += len(created) - bisect_left(created, month_ago)
+                except Exception as e:
+                    pass  # Error reading collection
             
-            total_notes += notes_count
-            total_words += words_count
-            total_chars += chars_count
+            names.append(collection_name)
+            notes_counts.append(notes_count)
+            words_counts.append(words_count)
+            chars_counts.append(chars_count)
+        
+        # Persist only when something was rescanned or a collection went away
+        if cache_changed or len(entries) != len(cache):
+            self._collection_stats_cache = entries
+            self.atomic_write_json(entries, self._stats_cache_file)
+        
+        current_collection = self.collection_manager.currentCollection
+        collection_stats = [
+            {
+                "name": name,
+                "notes": notes,
+                "words": words,
+                "chars": chars,
+                "isCurrent": name == current_collection
+            }
+            for name, notes, words, chars in zip(names, notes_counts, words_counts, chars_counts)
+        ]
         
         return {
-            "totalNotes": total_notes,
-            "totalWords": total_words,
-            "totalChars": total_chars,
+            "totalNotes": sum(notes_counts),
+            "totalWords": sum(words_counts),
+            "totalChars": sum(chars_counts),
             "totalSentences": total_sentences,
             "totalParagraphs": total_paragraphs,
             "notesThisWeek": notes_this_week,
@@ -103,68 +331,27 @@ class StatsManager(BaseManager):
             return {}
         
         content = note.get('content', '')
-        title = note.get('title', '')
-        
-        # Basic stats
-        char_count = len(content)
-        char_count_no_spaces = len(content.replace(' ', ''))
-        word_count = len(content.split()) if content.strip() else 0
-        line_count = content.count('\n') + 1 if content else 0
-        paragraph_count = len([p for p in content.split('\n\n') if p.strip()]) if content.strip() else 0
+        note_id = note.get('id')
         
-        # Literary-focused stats
-        sentence_count = len([s for s in re.split(r'[.!?]+', content) if s.strip()])
+        # Reopening stats for an unedited note reuses the previous tokenization.
+        # Ids are only unique within a collection, so the collection is part of the key.
+        cache = self._note_metrics_cache
+        cache_key = (self.collection_manager.currentCollection, note_id)
+        content_key = (len(content), hash(content))
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] == content_key:
+            cache.move_to_end(cache_key)
+            metrics = cached[1]
+        else:
+            metrics = _text_metrics(content)
+            if note_id is not None:
+                cache[cache_key] = (content_key, metrics)
+                cache.move_to_end(cache_key)
+                while len(cache) > NOTE_METRICS_CACHE_SIZE:
+                    cache.popitem(last=False)
         
-        # Average word length (helpful for readability)
-        words = content.split()
-        avg_word_length = sum(len(word.strip('.,!?;:"()[]{}')) for word in words) / len(words) if words else 0
-        
-        # Average sentence length
-        avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
-        
-        # Dialogue detection (rough estimate)
-        dialogue_lines = len([line for line in content.split('\n') if line.strip().startswith('"') or line.strip().startswith("'")])
-        
-        # Unique words count (vocabulary richness)
-        unique_words = len(set(word.lower().strip('.,!?;:"()[]{}') for word in words if word.strip('.,!?;:"()[]{}')))
-        lexical_diversity = unique_words / word_count if word_count > 0 else 0
-        
-        # Most common words (excluding common articles/prepositions)
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'this', 'that', 'these', 'those'}
-        content_words = [word.lower().strip('.,!?;:"()[]{}') for word in words if word.lower().strip('.,!?;:"()[]{}') not in stop_words and len(word.strip('.,!?;:"()[]{}')) > 2]
-        
-        word_freq = {}
-        for word in content_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Get top 3 most frequent words - convert tuples to lists for QML compatibility
-        most_common = [[word, count] for word, count in sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:3]]
-        
-        # Reading time estimates
-        reading_time_minutes = word_count / 200 if word_count > 0 else 0  # Silent reading
-        speaking_time_minutes = word_count / 150 if word_count > 0 else 0  # Speaking pace
-        
-        # Writing time estimate (rough - varies greatly by person and content type)
-        # Assume 20-30 words per minute for thoughtful writing
-        estimated_writing_time = word_count / 25 if word_count > 0 else 0
-        
-        return {
-            "title": title,
-            "chars": char_count,
-            "charsNoSpaces": char_count_no_spaces,
-            "words": word_count,
-            "uniqueWords": unique_words,
-            "lines": line_count,
-            "paragraphs": paragraph_count,
-            "sentences": sentence_count,
-            "dialogueLines": dialogue_lines,
-            "averageWordLength": round(avg_word_length, 1),
-            "averageSentenceLength": round(avg_sentence_length, 1),
-            "lexicalDiversity": round(lexical_diversity, 3),
-            "readingTimeMinutes": reading_time_minutes,
-            "speakingTimeMinutes": speaking_time_minutes,
-            "estimatedWritingTimeMinutes": estimated_writing_time,
-            "mostCommonWords": most_common,
-            "created": note.get('created', ''),
-            "modified": note.get('modified', '')
-        }
\ No newline at end of file
+        stats = {"title": note.get('title', '')}
+        stats.update(metrics)
+        stats["created"] = note.get('created', '')
+        stats["modified"] = note.get('modified', '')
+        return stats
@@ -1,5 +1,154 @@
-from PySide6.QtCore import Signal, Slot, Property
-from .base_manager import BaseManager
+from PySide6.QtCore import QThreadPool, Signal, Slot, Property
+from .base_manager import BaseManager, json_dumps, write_file_atomic
+import copy
+
+
+# The themes shipped with the app, used to seed data/user_themes.json
+_BUILTIN_THEMES = {
+    "nightOwl": {
+        "name": "Night Owl",
+        "background": "#011627",
+        "surface": "#1d3b53",
+        "primary": "#c792ea",
+        "primaryText": "#d6deeb",
+        "secondaryText": "#7fdbca",
+        "success": "#addb67",
+        "warning": "#ffcb6b",
+        "error": "#ef5350"
+    },
+    "dracula": {
+        "name": "Dracula",
+        "background": "#282a36",
+        "surface": "#44475a",
+        "primary": "#bd93f9",
+        "primaryText": "#f8f8f2",
+        "secondaryText": "#6272a4",
+        "success": "#50fa7b",
+        "warning": "#f1fa8c",
+        "error": "#ff5555"
+    },
+    "monokai": {
+        "name": "Monokai",
+        "background": "#272822",
+        "surface": "#3e3d32",
+        "primary": "#f92672",
+        "primaryText": "#f8f8f2",
+        "secondaryText": "#75715e",
+        "success": "#a6e22e",
+        "warning": "#e6db74",
+        "error": "#f92672"
+    },
+    "githubDark": {
+        "name": "GitHub Dark",
+        "background": "#0d1117",
+        "surface": "#21262d",
+        "primary": "#58a6ff",
+        "primaryText": "#f0f6fc",
+        "secondaryText": "#7d8590",
+        "success": "#238636",
+        "warning": "#d29922",
+        "error": "#f85149"
+    },
+    "catppuccin": {
+        "name": "Catppuccin",
+        "background": "#1e1e2e",
+        "surface": "#313244",
+        "primary": "#cba6f7",
+        "primaryText": "#cdd6f4",
+        "secondaryText": "#f9e2af",
+        "success": "#a6e3a1",
+        "warning": "#fab387",
+        "error": "#f38ba8"
+    },
+    "tokyoNight": {
+        "name": "Tokyo Night",
+        "background": "#1a1b26",
+        "surface": "#24283b",
+        "primary": "#7aa2f7",
+        "primaryText": "#c0caf5",
+        "secondaryText": "#9ece6a",
+        "success": "#9ece6a",
+        "warning": "#e0af68",
+        "error": "#f7768e"
+    },
+    "nordDark": {
+        "name": "Nord Dark",
+        "background": "#2e3440",
+        "surface": "#3b4252",
+        "primary": "#88c0d0",
+        "primaryText": "#eceff4",
+        "secondaryText": "#d08770",
+        "success": "#a3be8c",
+        "warning": "#ebcb8b",
+        "error": "#bf616a"
+    },
+    "gruvboxDark": {
+        "name": "Gruvbox Dark",
+        "background": "#282828",
+        "surface": "#3c3836",
+        "primary": "#83a598",
+        "primaryText": "#ebdbb2",
+        "secondaryText": "#fe8019",
+        "success": "#b8bb26",
+        "warning": "#fabd2f",
+        "error": "#fb4934"
+    },
+    "oneDark": {
+        "name": "One Dark",
+        "background": "#1e2127",
+        "surface": "#2c323c",
+        "primary": "#61afef",
+        "primaryText": "#abb2bf",
+        "secondaryText": "#e06c75",
+        "success": "#98c379",
+        "warning": "#e5c07b",
+        "error": "#e06c75"
+    },
+    "materialDark": {
+        "name": "Material Dark",
+        "background": "#121212",
+        "surface": "#1e1e1e",
+        "primary": "#bb86fc",
+        "primaryText": "#ffffff",
+        "secondaryText": "#03dac6",
+        "success": "#4caf50",
+        "warning": "#ff9800",
+        "error": "#f44336"
+    },
+    "ayuDark": {
+        "name": "Ayu Dark",
+        "background": "#0a0e14",
+        "surface": "#1f2430",
+        "primary": "#ffb454",
+        "primaryText": "#b3b1ad",
+        "secondaryText": "#e6b450",
+        "success": "#c2d94c",
+        "warning": "#ffb454",
+        "error": "#f07178"
+    },
+    "forest": {
+        "name": "Forest",
+        "background": "#1a2319",
+        "surface": "#2d3b2c",
+        "primary": "#7ec699",
+        "primaryText": "#e8f2e8",
+        "secondaryText": "#a8c9a8",
+        "success": "#90d4a0",
+        "warning": "#d4b85a",
+        "error": "#d97a7a"
+    },
+    "solarizedLight": {
+        "name": "Solarized Light",
+        "background": "#fdf6e3",
+        "surface": "#eee8d5",
+        "primary": "#268bd2",
+        "primaryText": "#586e75",
+        "secondaryText": "#93a1a1",
+        "success": "#859900",
+        "warning": "#b58900",
+        "error": "#dc322f"
+    }
+}
 
 
 class ThemeManager(BaseManager):
@@ -9,6 +158,11 @@ class ThemeManager(BaseManager):
         super().__init__()
         self.config_manager = config_manager
         self.user_themes_file = "data/user_themes.json"
+        self._user_themes_cache = None  # Parsed user themes; the file follows via save_user_themes
+        self._save_timer = self.create_save_timer(self.write_user_themes)
+        self._seed_write_pending = False  # Builtin themes being written in the background
+        # Only setTheme writes this key, so the attribute stays in step with the config
+        self._current_theme = config_manager.get_value("currentTheme", "githubDark")
         
         # Initialize themes
         self.ensure_directory_exists("data")
@@ -16,179 +170,101 @@ class ThemeManager(BaseManager):
     
     def get_builtin_themes(self):
         """Get the original builtin themes defined in code"""
-        return {
-            "nightOwl": {
-                "name": "Night Owl",
-                "background": "#011627",
-                "surface": "#1d3b53",
-                "primary": "#c792ea",
-                "primaryText": "#d6deeb",
-                "secondaryText": "#7fdbca",
-                "success": "#addb67",
-                "warning": "#ffcb6b",
-                "error": "#ef5350"
-            },
-            "dracula": {
-                "name": "Dracula",
-                "background": "#282a36",
-                "surface": "#44475a",
-                "primary": "#bd93f9",
-                "primaryText": "#f8f8f2",
-                "secondaryText": "#6272a4",
-                "success": "#50fa7b",
-                "warning": "#f1fa8c",
-                "error": "#ff5555"
-            },
-            "monokai": {
-                "name": "Monokai",
-                "background": "#272822",
-                "surface": "#3e3d32",
-                "primary": "#f92672",
-                "primaryText": "#f8f8f2",
-                "secondaryText": "#75715e",
-                "success": "#a6e22e",
-                "warning": "#e6db74",
-                "error": "#f92672"
-            },
-            "githubDark": {
-                "name": "GitHub Dark",
-                "background": "#0d1117",
-                "surface": "#21262d",
-                "primary": "#58a6ff",
-                "primaryText": "#f0f6fc",
-                "secondaryText": "#7d8590",
-                "success": "#238636",
-                "warning": "#d29922",
-                "error": "#f85149"
-            },
-            "catppuccin": {
-                "name": "Catppuccin",
-                "background": "#1e1e2e",
-                "surface": "#313244",
-                "primary": "#cba6f7",
-                "primaryText": "#cdd6f4",
-                "secondaryText": "#f9e2af",
-                "success": "#a6e3a1",
-                "warning": "#fab387",
-                "error": "#f38ba8"
-            },
-            "tokyoNight": {
-                "name": "Tokyo Night",
-                "background": "#1a1b26",
-                "surface": "#24283b",
-                "primary": "#7aa2f7",
-                "primaryText": "#c0caf5",
-                "secondaryText": "#9ece6a",
-                "success": "#9ece6a",
-                "warning": "#e0af68",
-                "error": "#f7768e"
-            },
-            "nordDark": {
-                "name": "Nord Dark",
-                "background": "#2e3440",
-                "surface": "#3b4252",
-                "primary": "#88c0d0",
-                "primaryText": "#eceff4",
-                "secondaryText": "#d08770",
-                "success": "#a3be8c",
-                "warning": "#ebcb8b",
-                "error": "#bf616a"
-            },
-            "gruvboxDark": {
-                "name": "Gruvbox Dark",
-                "background": "#282828",
-                "surface": "#3c3836",
-                "primary": "#83a598",
-                "primaryText": "#ebdbb2",
-                "secondaryText": "#fe8019",
-                "success": "#b8bb26",
-                "warning": "#fabd2f",
-                "error": "#fb4934"
-            },
-            "oneDark": {
-                "name": "One Dark",
-                "background": "#1e2127",
-                "surface": "#2c323c",
-                "primary": "#61afef",
-                "primaryText": "#abb2bf",
-                "secondaryText": "#e06c75",
-                "success": "#98c379",
-                "warning": "#e5c07b",
-                "error": "#e06c75"
-            },
-            "materialDark": {
-                "name": "Material Dark",
-                "background": "#121212",
-                "surface": "#1e1e1e",
-                "primary": "#bb86fc",
-                "primaryText": "#ffffff",
-                "secondaryText": "#03dac6",
-                "success": "#4caf50",
-                "warning": "#ff9800",
-                "error": "#f44336"
-            },
-            "ayuDark": {
-                "name": "Ayu Dark",
-                "background": "#0a0e14",
-                "surface": "#1f2430",
-                "primary": "#ffb454",
-                "primaryText": "#b3b1ad",
-                "secondaryText": "#e6b450",
-                "success": "#c2d94c",
-                "warning": "#ffb454",
-                "error": "#f07178"
-            },
-            "forest": {
-                "name": "Forest",
-                "background": "#1a2319",
-                "surface": "#2d3b2c",
-                "primary": "#7ec699",
-                "primaryText": "#e8f2e8",
-                "secondaryText": "#a8c9a8",
-                "success": "#90d4a0",
-                "warning": "#d4b85a",
-                "error": "#d97a7a"
-            },
-            "solarizedLight": {
-                "name": "Solarized Light",
-                "background": "#fdf6e3",
-                "surface": "#eee8d5",
-                "primary": "#268bd2",
-                "primaryText": "#586e75",
-                "secondaryText": "#93a1a1",
-                "success": "#859900",
-                "warning": "#b58900",
-                "error": "#dc322f"
-            }
-        }
+        # Deep copy: callers store and edit the result as the user themes
+        return copy.deepcopy(_BUILTIN_THEMES)
 
     def _ensure_user_themes_exist(self):
         """Ensure user themes file exists, create from builtins if needed"""
-        if not self.read_json_file(self.user_themes_file):
-            builtin_themes = self.get_builtin_themes()
-            self.atomic_write_json(builtin_themes, self.user_themes_file)
+        # Loading recreates a missing file and primes the cache
+        self.load_user_themes()
 
     def load_user_themes(self):
         """Load user themes, initializing from builtin themes if needed"""
+        if self._user_themes_cache is not None:
+            return self._user_themes_cache
+        
         themes = self.read_json_file(self.user_themes_file)
         if not themes:
-            # If user themes file is corrupted or missing, recreate from builtins
+            # If user themes file is corrupted or missing, recreate from builtins;
+            # the in-memory copy serves callers while the file is written
             themes = self.get_builtin_themes()
-            self.atomic_write_json(themes, self.user_themes_file)
+            self._write_seed_themes(themes)
+        self._user_themes_cache = themes
         return themes
 
+    def _write_seed_themes(self, themes):
+        """Write the initial user themes file on the thread pool instead of the UI thread"""
+        data = json_dumps(themes)  # Serialized here; later edits must not reach the worker
+        filepath = self.user_themes_file
+        
+        def write():
+            try:
+                write_file_atomic(filepath, data)
+            except Exception as e:
+                self.error.emit(f"Error writing file {filepath}: {e}")
+        
+        self._seed_write_pending = True
+        QThreadPool.globalInstance().start(write)
+
+    def _wait_for_seed_write(self):
+        """Block until the background initial write, if any, has finished"""
+        if self._seed_write_pending:
+            QThreadPool.globalInstance().waitForDone()
+            self._seed_write_pending = False
+
     def save_user_themes(self, themes):
-        """Save user themes to file"""
-        return self.atomic_write_json(themes, self.user_themes_file)
+        """Save user themes, writing the file once a burst of edits settles"""
+        self._user_themes_cache = themes
+        self.schedule_save()
+        # True means the edit was accepted; the write comes later, so a failure to
+        # write is reported asynchronously through the error signal (write_user_themes)
+        return True
+
+    def write_user_themes(self):
+        """Write the in-memory user themes to file"""
+        self._save_timer.stop()  # This write covers any pending deferred save
+        self._wait_for_seed_write()  # Both would go through the same temporary file
+        if self._user_themes_cache is None:
+            return True
+        # On failure atomic_write_json emits error; the themes stay in memory and the
+        # next edit or flush tries the write again
+        return self.atomic_write_json(self._user_themes_cache, self.user_themes_file)
+
+    def schedule_save(self):
+        """Save after a short quiet period, coalescing rapid theme edits into one write"""
+        self._save_timer.start()
+
+    def flush_pending_save(self):
+        """Write a deferred save immediately, if one is pending"""
+        if self._save_timer.isActive():
+            self.write_user_themes()
+        else:
+            self._wait_for_seed_write()
+
+    def _pack_theme(self, name, background, surface, primary, primaryText, secondaryText, success, warning, error):
+        """Build a theme entry from its name and colors"""
+        return {
+            "name": name,
+            "background": background,
+            "surface": surface,
+            "primary": primary,
+            "primaryText": primaryText,
+            "secondaryText": secondaryText,
+            "success": success,
+            "warning": warning,
+            "error": error
+        }
 
     # QML-accessible methods
     @Slot(str)
     def setTheme(self, theme_name):
-        self.config_manager.set_value("currentTheme", theme_name)
+        self._current_theme = theme_name
+        # Deferred: sweeping through themes should not write the config per step
+        self.config_manager.set_value("currentTheme", theme_name, deferred=True)
 
     @Slot(result=str)
     def getCurrentTheme(self):
-        return self.config_manager.get_value("currentTheme", "githubDark")
+        return self._current_theme
 
     @Slot(result=list)
     def getAvailableThemes(self):
@@ -214,17 +290,7 @@ class ThemeManager(BaseManager):
             return False
             
         themes = self.load_user_themes()
-        themes[key] = {
-            "name": name,
-            "background": background,
-            "surface": surface,
-            "primary": primary,
-            "primaryText": primaryText,
-            "secondaryText": secondaryText,
-            "success": success,
-            "warning": warning,
-            "error": error
-        }
+        themes[key] = self._pack_theme(name, background, surface, primary, primaryText, secondaryText, success, warning, error)
         return self.save_user_themes(themes)
 
     @Slot(str, str, str, str, str, str, str, str, str, str, result=bool)
@@ -237,17 +303,7 @@ class ThemeManager(BaseManager):
         if key not in themes:
             return False
             
-        themes[key] = {
-            "name": name,
-            "background": background,
-            "surface": surface,
-            "primary": primary,
-            "primaryText": primaryText,
-            "secondaryText": secondaryText,
-            "success": success,
-            "warning": warning,
-            "error": error
-        }
+        themes[key] = self._pack_theme(name, background, surface, primary, primaryText, secondaryText, success, warning, error)
         return self.save_user_themes(themes)
 
     @Slot(str, result=bool)
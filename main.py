@@ -14,6 +14,7 @@ def main():
     
     engine = QQmlApplicationEngine()
     main_manager = MainManager()
+    app.aboutToQuit.connect(main_manager.flush_pending_saves)
     
     engine.rootContext().setContextProperty("notesManager", main_manager)
     engine.load(QUrl.fromLocalFile("qml/main.qml"))
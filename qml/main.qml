@@ -31,40 +31,6 @@ ApplicationWindow {
         }
     }
 
-    // Handle card bounds updates when screen size changes
-    Connections {
-        target: notesManager
-        function onCardBoundsNeedUpdate() {
-            // Force cards to fill bounds with actual grid dimensions
-            if (gridViewRef && appState.isGridView()) {
-                notesManager.forceCardFillBounds(gridViewRef.width, gridViewRef.leftMargin)
-            } else if (appState.isGridView()) {
-                // GridView not ready yet, retry after a short delay
-                cardBoundsUpdateTimer.restart()
-            }
-        }
-    }
-
-    // Timer to retry card bounds update when GridView is not ready initially
-    Timer {
-        id: cardBoundsUpdateTimer
-        interval: 100
-        repeat: true
-        property int retryCount: 0
-        onTriggered: {
-            if (gridViewRef && appState.isGridView()) {
-                notesManager.forceCardFillBounds(gridViewRef.width, gridViewRef.leftMargin)
-                stop()
-                retryCount = 0
-            } else if (retryCount < 20) { // Try for up to 2 seconds
-                retryCount++
-            } else {
-                stop()
-                retryCount = 0
-            }
-        }
-    }
-
     // Save window size when closing
     onClosing: (close) => {
         notesManager.setWindowSize(width, height)
@@ -112,9 +78,6 @@ ApplicationWindow {
         if (savedTheme) {
             colors.setTheme(savedTheme)
         }
-        
-        // Start font loading immediately but asynchronously
-        notesManager.preloadFonts()
     }
 
     function toggleFullscreen() {
@@ -854,7 +817,11 @@ ApplicationWindow {
             unsavedChanges = 0
             
             if (showNotification) {
-                notification.show("Note saved", "success")
+                // An explicit save is written now rather than after the autosave delay;
+                // a failure is reported through onSaveError instead
+                if (notesManager.saveNow()) {
+                    notification.show("Note saved", "success")
+                }
             }
         }
     }
@@ -2805,6 +2772,9 @@ ApplicationWindow {
         // Update when modal state changes  
         onVisibleChanged: {
             if (visible) {
+                // First open starts the background scan for the full font list
+                notesManager.ensureFontsLoaded()
+                
                 // INSTANT: Load fonts immediately (basic fonts available instantly)
                 var fonts = notesManager.getAvailableFonts()
                 if (fonts.length > 0) {
@@ -2816,9 +2786,6 @@ ApplicationWindow {
                 updateSelectedIndex()
                 searchBuffer = ""
                 searchClearTimer.stop()
-                
-                // Start background loading for full font list
-                notesManager.preloadFonts()
             }
         }
 
@@ -3787,8 +3754,19 @@ ApplicationWindow {
                         topMargin: 20
                         bottomMargin: 20
 
-                        cellWidth: notesManager.config.cardWidth + 20
-                        cellHeight: notesManager.config.cardHeight + 20
+                        // Each collection keeps a chosen column count, so the cards stretch
+                        // to fill that many columns rather than the count following a
+                        // minimum card width as the window is resized
+                        property int cardWidth: {
+                            var spacing = notesManager.cardSpacing
+                            var available = width - leftMargin - notesManager.gridRightInset
+                            var columns = Math.max(1, notesManager.preferredColumns)
+                            if (columns === 1) return Math.max(1, Math.floor(available))
+                            return Math.max(1, Math.floor((available - (columns - 1) * spacing) / columns))
+                        }
+
+                        cellWidth: cardWidth + notesManager.cardSpacing
+                        cellHeight: notesManager.config.cardHeight + notesManager.cardSpacing
                         model: notesManager
 
                         Component.onCompleted: {
@@ -3819,7 +3797,7 @@ ApplicationWindow {
 
                         delegate: Rectangle {
                             id: noteCard
-                            width: notesManager.config.cardWidth
+                            width: notesGrid.cardWidth
                             height: notesManager.config.cardHeight
                             color: index === selectedNoteIndex ? 
                                     colors.selectedColor : 
@@ -3917,7 +3895,7 @@ ApplicationWindow {
                                         return ""
                                     }
                                     font.family: notesManager.config.fontFamily
-                                    font.pixelSize: Math.min(notesManager.config.cardWidth *.05, 14)
+                                    font.pixelSize: Math.min(notesGrid.cardWidth *.05, 14)
                                     color: colors.secondaryText
                                     opacity: 0.5
                                     width: parent.width